@@ -1,14 +1,116 @@
 import inspect
 from enum import Enum
-from typing import Dict, Any, Type, Callable, Optional, TypeVar
+from typing import Dict, Any, Type, Callable, Optional, TypeVar, Generic, List, Iterable, Tuple, get_origin, get_args
 from abc import ABC, ABCMeta
 import contextvars
+import threading
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from functools import wraps
+from collections import OrderedDict, deque
+import collections.abc
 import sys
 import importlib
 import importlib.util
+import pkgutil
+import ast
+import hashlib
+import json
+import os
+import logging
+import weakref
 from pathlib import Path
 
+# Tanı kanalı: varsayılan olarak kapalı (NullHandler); açmak için enable_diagnostics()
+logger = logging.getLogger("ioc_container")
+logger.addHandler(logging.NullHandler())
+
+
+_diagnostics_handler: Optional[logging.Handler] = None  # enable_diagnostics'in taktığı son handler
+
+
+def enable_diagnostics(level: int = logging.DEBUG, handler: Optional[logging.Handler] = None) -> logging.Logger:
+    """
+    Container tanı kayıtlarını (keşif süreleri, taranan modüller, aday skorları) verilen handler'a yönlendir.
+    Tekrar çağrılırsa önceki çağrının handler'ı değiştirilir; satırlar çoğalmaz.
+    """
+    global _diagnostics_handler
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    if _diagnostics_handler is not None:
+        logger.removeHandler(_diagnostics_handler)
+    _diagnostics_handler = handler
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return logger
+
+class _ImplementationIndex:
+    """
+    sys.modules'daki sınıfların bellek içi indeksi.
+    Modüller sadece yeniyse ya da isim sayıları değiştiyse (ör. __main__ veya import döngüsünün ortasında
+    yarım yüklenmiş bir modül sonradan sınıf tanımladıysa) taranır; aramalar isim/tip üzerinden dict lookup'tır.
+    """
+    def __init__(self):
+        self._scanned: Dict[str, int] = {}  # modül adı -> tarandığındaki isim sayısı
+        self._seen: set = set()
+        self.classes: list = []  # somut sınıflar
+        self.by_name: Dict[str, list] = {}
+        self.version = 0
+        self._virtual_cache: Dict[Type, tuple] = {}
+
+    def refresh(self) -> None:
+        """Yeni ya da taranmasından sonra isim eklenmiş modülleri indekse ekle"""
+        changed = []
+        for mod_name, mod in list(sys.modules.items()):
+            try:
+                size = len(vars(mod)) if mod else 0
+            except TypeError:
+                size = 0
+            if self._scanned.get(mod_name) != size:
+                self._scanned[mod_name] = size
+                if size:
+                    changed.append(mod)
+        if not changed:
+            return
+        for mod in changed:
+            try:
+                members = list(vars(mod).values())
+            except TypeError:
+                continue
+            for obj in members:
+                if not inspect.isclass(obj) or id(obj) in self._seen:
+                    continue
+                self._seen.add(id(obj))
+                try:
+                    if inspect.isabstract(obj):
+                        continue
+                except Exception:
+                    continue
+                self.classes.append(obj)
+                self.by_name.setdefault(obj.__name__, []).append(obj)
+        self.version += 1
+
+    def subclasses_of(self, cls: Type) -> list:
+        """issubclass ile eşleşen somut sınıflar (ABC.register ile sanal alt sınıflar dahil) - sürüm başına cache'li"""
+        cached = self._virtual_cache.get(cls)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        out = []
+        for obj in self.classes:
+            try:
+                if obj is not cls and issubclass(obj, cls):
+                    out.append(obj)
+            except Exception:
+                continue
+        self._virtual_cache[cls] = (self.version, out)
+        return out
+
+
+_implementation_index = _ImplementationIndex()
+
+
 def _all_concrete_subclasses(cls):
     """Tüm concrete subclass'ları bul - derin modül yapısını da tara"""
     seen, out = set(), []
@@ -25,35 +127,310 @@ def _all_concrete_subclasses(cls):
     
     walk(cls)
     
-    # Eğer hiç bulunamadıysa, yüklü modüllerde ara
+    # Eğer hiç bulunamadıysa, yüklü modüllerin indeksinde ara
     if not out:
-        cls_name = cls.__name__
-        for mod_name, mod in sys.modules.items():
-            if not mod or not hasattr(mod, '__file__'):
-                continue
-            
-            try:
-                for name, obj in inspect.getmembers(mod, inspect.isclass):
-                    if (obj != cls and 
-                        issubclass(obj, cls) and 
-                        not inspect.isabstract(obj) and
-                        obj not in seen):
-                        out.append(obj)
-                        seen.add(obj)
-            except:
-                continue
+        _implementation_index.refresh()
+        for obj in _implementation_index.subclasses_of(cls):
+            if obj not in seen:
+                out.append(obj)
+                seen.add(obj)
     
     return out
 
-def _deep_module_discovery(root_dir: Path = None):
-    """Derin klasör yapılarındaki modülleri keşfet ve yükle"""
-    if root_dir is None:
-        # Çağrılan dosyanın dizinini bul
-        import __main__
-        if hasattr(__main__, '__file__'):
-            root_dir = Path(__main__.__file__).parent
+def _default_root_dir() -> Path:
+    """Keşif kökü: çağrılan (__main__) dosyanın dizini, yoksa cwd"""
+    import __main__
+    if hasattr(__main__, '__file__'):
+        return Path(__main__.__file__).parent
+    return Path.cwd()
+
+
+def _is_discoverable(py_file: Path) -> bool:
+    """Keşifte atlanacak dosyaları ele"""
+    return not (py_file.stem.startswith("__") or
+                py_file.stem.startswith("test_") or
+                "py_autowired" in py_file.stem or
+                "ioc_container" in py_file.stem or
+                py_file.name == "setup.py")
+
+
+def _module_name_for(py_file: Path, root_dir: Path) -> str:
+    """Dosya yolundan modül adını oluştur"""
+    parts = []
+    current = py_file.parent
+
+    # Dosya adını ekle
+    if py_file.stem != "__init__":
+        parts.append(py_file.stem)
+
+    # Package yapısını bul
+    while current >= root_dir and current != current.parent:
+        parts.append(current.name)
+        current = current.parent
+        if current == root_dir:
+            break
+
+    parts.reverse()
+    return ".".join(parts) if parts else py_file.stem
+
+
+def _import_module_file(module_name: str, py_file: Path) -> bool:
+    """Modülü yükle; zaten yüklüyse ya da yüklenemezse False döner"""
+    if module_name in sys.modules:
+        return False
+    try:
+        # Önce normal import
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
+        # Doğrudan dosyadan yükle
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                return True
+        except:
+            pass
+    return False
+
+
+def _qualified_ref(obj: Any) -> Optional[Dict[str, Any]]:
+    """
+    Modül seviyesindeki sınıf/fonksiyon için snapshot referansı; yerel/lambda ise None.
+    __main__'de tanımlananlar da None: snapshot'ı yükleyen süreçte __main__ başka bir modüldür.
+    """
+    module_name = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module_name or module_name == "__main__" or not qualname or "<" in qualname:
+        return None
+    return {"module": module_name, "qualname": qualname,
+            "file": getattr(sys.modules.get(module_name), "__file__", None)}
+
+
+def _load_qualified(ref: Dict[str, Any]) -> Any:
+    """Snapshot referansını yükle: modül yüklü değilse adıyla, olmazsa dosyasından import edilir"""
+    module_name = ref["module"]
+    if module_name not in sys.modules:
+        if ref.get("file"):
+            _import_module_file(module_name, Path(ref["file"]))
         else:
-            root_dir = Path.cwd()
+            importlib.import_module(module_name)
+    obj = sys.modules.get(module_name)
+    if obj is None:
+        raise ImportError(f"Snapshot modülü yüklenemedi: {module_name}")
+    for part in ref["qualname"].split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+class DiscoveryIndex:
+    """
+    Kök dizindeki .py dosyalarının disk üzerindeki keşif indeksi.
+    Her dosya için modül adı, mtime/boyut ve tanımlı sınıflar ile base isimleri, abstract ve gövdede
+    tanımlı method adları (AST ile) tutulur; sadece değişen dosyalar yeniden parse edilir.
+    İndeks dosyası varsayılan olarak kök dizine yazılır; IOC_DISCOVERY_INDEX_DIR ortam değişkeni verilmişse
+    o dizine, kök yolundan türetilmiş bir adla yazılır (kaynak ağacı yazılmaz kalır).
+    """
+    FILE_NAME = ".ioc_discovery_index.json"
+    DIR_ENV = "IOC_DISCOVERY_INDEX_DIR"
+    VERSION = 3
+
+    def __init__(self, root_dir: Path, index_path: Optional[Path] = None):
+        self.root_dir = Path(root_dir)
+        self.index_path = Path(index_path) if index_path else self._default_index_path(self.root_dir)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def _default_index_path(cls, root_dir: Path) -> Path:
+        index_dir = os.environ.get(cls.DIR_ENV)
+        if not index_dir:
+            return root_dir / cls.FILE_NAME
+        digest = hashlib.sha1(str(root_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+        return Path(index_dir) / f"ioc_discovery_index-{digest}.json"
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION:
+            self.entries = data.get("files", {})
+
+    def save(self) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"version": self.VERSION, "files": self.entries}),
+                                encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # Yazılamayan dizinde indeks sadece bellekte kalır
+
+    @staticmethod
+    def _scan_classes(py_file: Path) -> Dict[str, Dict[str, Any]]:
+        """Dosyayı import etmeden sınıf tanımlarını, base ifadelerini, abstract ve tanımlı method adlarını çıkar"""
+        try:
+            tree = ast.parse(py_file.read_bytes(), filename=str(py_file))
+        except (OSError, SyntaxError, ValueError):
+            return {}
+        classes = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                bases = []
+                for base in node.bases:
+                    try:
+                        bases.append(ast.unparse(base))
+                    except Exception:
+                        continue
+                abstract, defines = [], []
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        if any((d.id if isinstance(d, ast.Name) else getattr(d, "attr", "")) == "abstractmethod"
+                               for d in item.decorator_list):
+                            abstract.append(item.name)
+                        else:
+                            defines.append(item.name)
+                    elif isinstance(item, ast.Assign):
+                        defines.extend(t.id for t in item.targets if isinstance(t, ast.Name))
+                    elif isinstance(item, ast.AnnAssign) and item.value is not None \
+                            and isinstance(item.target, ast.Name):
+                        defines.append(item.target.id)
+                classes[node.name] = {"bases": bases, "abstract": abstract, "defines": defines}
+        return classes
+
+    def refresh(self) -> int:
+        """Dizini tara, yeni/değişen dosyaları parse et, silinenleri çıkar; güncellenen dosya sayısını döner"""
+        start = time.perf_counter()
+        py_files = [p for p in self.root_dir.rglob("*.py") if _is_discoverable(p)]
+        seen = set()
+        changed = 0
+        for py_file in py_files:
+            key = py_file.relative_to(self.root_dir).as_posix()
+            seen.add(key)
+            try:
+                stat = py_file.stat()
+            except OSError:
+                continue
+            entry = self.entries.get(key)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            self.entries[key] = {
+                "module": _module_name_for(py_file, self.root_dir),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "classes": self._scan_classes(py_file),
+            }
+            changed += 1
+
+        removed = [key for key in self.entries if key not in seen]
+        for key in removed:
+            del self.entries[key]
+
+        if changed or removed:
+            self.save()
+        logger.debug("Keşif indeksi tazelendi: %s - %d dosya tarandı, %d parse edildi, %d silindi (%.1f ms)",
+                     self.root_dir, len(py_files), changed, len(removed),
+                     (time.perf_counter() - start) * 1000)
+        return changed
+
+    def modules(self):
+        """(modül adı, dosya yolu) çiftleri - derinliğe göre sıralı"""
+        keys = sorted(self.entries, key=lambda k: len(k.split("/")))
+        return [(self.entries[k]["module"], self.root_dir / k) for k in keys]
+
+    def candidate_classes(self, service_type: Type):
+        """
+        Servis tipini (isimle, dolaylı olarak da) miras alan sınıflar; yoksa isim kuralına uyanlar.
+        (sınıf adı, modül adı, dosya yolu, soyut mu) listesi döner.
+        """
+        names = {service_type.__name__}
+        # Ara sınıflar üzerinden gelen alt sınıfları da yakalamak için sabit noktaya kadar genişlet
+        grew = True
+        while grew:
+            grew = False
+            for entry in self.entries.values():
+                for cls_name, info in entry["classes"].items():
+                    if cls_name not in names and any(b.rsplit(".", 1)[-1] in names for b in info["bases"]):
+                        names.add(cls_name)
+                        grew = True
+        names.discard(service_type.__name__)
+
+        abstract_methods = self._abstract_resolver(service_type)
+
+        def collect(wanted):
+            found = []
+            for module_name, path in self.modules():
+                classes = self.entries[path.relative_to(self.root_dir).as_posix()]["classes"]
+                for cls_name, info in classes.items():
+                    if cls_name in wanted:
+                        found.append((cls_name, module_name, path, bool(abstract_methods(info))))
+            return found
+
+        return collect(names) or collect(set(_convention_names(service_type.__name__)))
+
+    def _abstract_resolver(self, service_type: Type) -> Callable[[Dict[str, Any]], frozenset]:
+        """
+        İndeksteki bir sınıfın gerçeklenmemiş abstract method adlarını (miras alınanlar dahil) bulan fonksiyon.
+        Base'ler isimle indekste aranır; servis tipinin kendisi için yüklü sınıfın __abstractmethods__'u
+        kullanılır. `class BaseRepo(IRepo): pass` gibi ara sınıflar böylece soyut sayılır.
+        """
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries.values():
+            for cls_name, info in entry["classes"].items():
+                by_name.setdefault(cls_name, info)
+        known = {service_type.__name__: frozenset(getattr(service_type, "__abstractmethods__", ()))}
+        memo: Dict[int, frozenset] = {}
+
+        def abstract_methods(info: Dict[str, Any]) -> frozenset:
+            key = id(info)
+            if key in memo:
+                return memo[key]
+            memo[key] = frozenset()  # miras döngüsüne karşı
+            names = set(info["abstract"])
+            for base in info["bases"]:
+                base_name = base.rsplit(".", 1)[-1]
+                inherited = known.get(base_name)
+                if inherited is None:
+                    base_info = by_name.get(base_name)
+                    inherited = abstract_methods(base_info) if base_info is not None else ()
+                names.update(name for name in inherited if name not in info["defines"])
+            memo[key] = frozenset(names)
+            return memo[key]
+        return abstract_methods
+
+    def candidate_modules(self, service_type: Type):
+        """Aday sınıf içeren modüller: (modül adı, dosya yolu)"""
+        seen, out = set(), []
+        for _, module_name, path, _ in self.candidate_classes(service_type):
+            if module_name not in seen:
+                seen.add(module_name)
+                out.append((module_name, path))
+        return out
+
+
+_discovery_indexes: Dict[str, DiscoveryIndex] = {}
+
+
+def _discovery_index(root_dir: Path = None, refresh: bool = False) -> DiscoveryIndex:
+    """Kök başına tek indeks; süreç içinde ilk kullanımda (ya da istenince) tazelenir"""
+    root_dir = _default_root_dir() if root_dir is None else Path(root_dir)
+    key = str(root_dir.resolve())
+    index = _discovery_indexes.get(key)
+    if index is None:
+        index = _discovery_indexes[key] = DiscoveryIndex(root_dir)
+        index.refresh()
+    elif refresh:
+        index.refresh()
+    return index
+
+
+def _deep_module_discovery(root_dir: Path = None, force: bool = False):
+    """Derin klasör yapılarındaki modülleri keşfet ve yükle (disk indeksi üzerinden)"""
+    if root_dir is None:
+        root_dir = _default_root_dir()
     else:
         root_dir = Path(root_dir)
     
@@ -62,151 +439,431 @@ def _deep_module_discovery(root_dir: Path = None):
     if root_str not in sys.path:
         sys.path.insert(0, root_str)
     
-    # Tüm Python dosyalarını bul (sınırsız derinlik)
-    py_files = list(root_dir.rglob("*.py"))
-    
-    # Derinliğe göre sırala
-    py_files.sort(key=lambda p: len(p.relative_to(root_dir).parts))
-    
+    start = time.perf_counter()
+    index = _discovery_index(root_dir, refresh=force)
+
     loaded = 0
-    for py_file in py_files:
-        # Skip edilecek dosyalar
-        if (py_file.stem.startswith("__") or 
-            py_file.stem.startswith("test_") or
-            "py_autowired" in py_file.stem or
-            "ioc_container" in py_file.stem or
-            py_file.name == "setup.py"):
-            continue
-        
-        # Modül adını oluştur
+    for module_name, py_file in index.modules():
         try:
-            parts = []
-            current = py_file.parent
-            
-            # Dosya adını ekle
-            if py_file.stem != "__init__":
-                parts.append(py_file.stem)
-            
-            # Package yapısını bul
-            while current >= root_dir and current != current.parent:
-                parts.append(current.name)
-                current = current.parent
-                if current == root_dir:
-                    break
-            
-            parts.reverse()
-            module_name = ".".join(parts) if parts else py_file.stem
-            
-            # Modülü yükle
-            if module_name not in sys.modules:
-                try:
-                    # Önce normal import
-                    importlib.import_module(module_name)
-                    loaded += 1
-                except ImportError:
-                    # Doğrudan dosyadan yükle
-                    try:
-                        spec = importlib.util.spec_from_file_location(module_name, py_file)
-                        if spec and spec.loader:
-                            module = importlib.util.module_from_spec(spec)
-                            sys.modules[module_name] = module
-                            spec.loader.exec_module(module)
-                            loaded += 1
-                    except:
-                        pass
+            if _import_module_file(module_name, py_file):
+                loaded += 1
         except:
             continue
     
+    logger.debug("Derin keşif: %s - %d modül tarandı, %d yüklendi (%.1f ms)",
+                 root_dir, len(index.entries), loaded, (time.perf_counter() - start) * 1000)
     return loaded
 
+
+def _import_candidate_modules(service_type: Type, root_dir: Path = None) -> int:
+    """İndekse bakarak sadece servis tipine aday sınıf içeren modülleri yükle"""
+    root_dir = _default_root_dir() if root_dir is None else Path(root_dir)
+    root_str = str(root_dir.resolve())
+    if root_str not in sys.path:
+        sys.path.insert(0, root_str)
+
+    loaded = 0
+    candidates = _discovery_index(root_dir).candidate_modules(service_type)
+    for module_name, py_file in candidates:
+        try:
+            if _import_module_file(module_name, py_file):
+                loaded += 1
+        except:
+            continue
+    logger.debug("%s için %d aday modül, %d yeni yüklendi: %s", service_type.__name__,
+                 len(candidates), loaded, [module_name for module_name, _ in candidates])
+    return loaded
+
+
+def _convention_names(sname: str) -> list:
+    """IService -> Service, ServiceImpl, ... isim kuralı adayları"""
+    if sname.startswith('I') and len(sname) > 1 and sname[1].isupper():
+        base = sname[1:]
+        return [
+            base,
+            f"{base}Impl",
+            f"{base}Implementation",
+            f"Default{base}",
+            f"Concrete{base}"
+        ]
+    return []
+
 def _guess_impl(service_type):
     """Implementation'ı tahmin et - geliştirilmiş versiyon"""
-    # Önce derin modül keşfi yap
-    _deep_module_discovery()
+    cands = _guess_candidates(service_type)
+    return cands[0] if cands else None
+
+
+def _guess_candidates(service_type, discover: bool = True) -> list:
+    """Adayları skora göre (en iyi başta) sıralı döndür; discover=False ise modül yüklemez"""
+    if discover:
+        # Tüm ağacı yeniden taramak yerine indeksteki aday modülleri yükle
+        _import_candidate_modules(service_type)
     
     # Sonra normal akış
     cands = _all_concrete_subclasses(service_type)
     if not cands:
         # Naming convention ile ara
-        sname = service_type.__name__
-        possible_names = []
-        
         # IService -> Service
-        if sname.startswith('I') and len(sname) > 1 and sname[1].isupper():
-            base = sname[1:]
-            possible_names.extend([
-                base,
-                f"{base}Impl",
-                f"{base}Implementation",
-                f"Default{base}",
-                f"Concrete{base}"
-            ])
+        possible_names = _convention_names(service_type.__name__)
         
-        # Tüm modüllerde ara
-        for mod_name, mod in sys.modules.items():
-            if not mod:
-                continue
-            
-            try:
-                for name, obj in inspect.getmembers(mod, inspect.isclass):
-                    if (name in possible_names and 
-                        not inspect.isabstract(obj)):
-                        
-                        # Interface'i implement ediyor mu kontrol et
-                        try:
-                            if (hasattr(service_type, '__abstractmethods__') and
-                                all(hasattr(obj, method) for method in service_type.__abstractmethods__)):
-                                cands.append(obj)
-                        except:
-                            # Duck typing - method isimleri uyuşuyor mu?
-                            service_methods = [m for m in dir(service_type) 
-                                             if not m.startswith('_')]
-                            if all(hasattr(obj, m) for m in service_methods):
-                                cands.append(obj)
-            except:
-                continue
+        # İndekste isimle ara
+        _implementation_index.refresh()
+        for name in possible_names:
+            for obj in _implementation_index.by_name.get(name, ()):
+                # Interface'i implement ediyor mu kontrol et
+                try:
+                    if (hasattr(service_type, '__abstractmethods__') and
+                        all(hasattr(obj, method) for method in service_type.__abstractmethods__)):
+                        cands.append(obj)
+                except:
+                    # Duck typing - method isimleri uyuşuyor mu?
+                    service_methods = [m for m in dir(service_type) 
+                                     if not m.startswith('_')]
+                    if all(hasattr(obj, m) for m in service_methods):
+                        cands.append(obj)
         
         if not cands:
-            return None
+            return []
     
     # Skorlama ve seçim
+    cands.sort(key=lambda c: _candidate_score(c.__name__, getattr(c, "__module__", "") or "",
+                                              service_type), reverse=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_candidate_scores(service_type, [(c.__name__, getattr(c, "__module__", "") or "")
+                                             for c in cands])
+    return cands
+
+
+def _log_candidate_scores(service_type: Type, cands: list) -> None:
+    """(sınıf adı, modül adı) adaylarını skorlarıyla birlikte logla - sadece DEBUG açıkken çağrılır"""
+    for name, cmod in cands:
+        samemod, samepkg, depth_score, namepref = _candidate_score(name, cmod, service_type)
+        logger.debug("  %s adayı %s.%s: aynı modül=%d, aynı paket=%d, derinlik=%d, isim=%d",
+                     service_type.__name__, cmod, name, samemod, samepkg, depth_score, namepref)
+
+
+def _candidate_score(name: str, cmod: str, service_type: Type):
+    """Aday implementation'ı isim ve modül yakınlığına göre puanla"""
     sname = service_type.__name__
     prefs = {sname.lstrip('I'), f"{sname}Impl", f"{sname}Implementation"}
-    spkg = (getattr(service_type, "__module__", "") or "").split(".")[0]
-    
-    def score(c):
-        name = c.__name__
-        cmod = getattr(c, "__module__", "") or ""
-        smod = getattr(service_type, "__module__", "") or ""
-        
-        # Aynı modüldeyse en yüksek skor
-        samemod = 100 if cmod == smod else 0
-        
-        # Aynı package tree'deyse
-        samepkg = 50 if cmod.split(".")[0] == spkg else 0
-        
-        # Modül derinliği benzerliği
-        depth_diff = abs(len(cmod.split(".")) - len(smod.split(".")))
-        depth_score = max(0, 20 - depth_diff * 5)
-        
-        # İsim tercihi
-        namepref = 30 if name in prefs else 0
-        
-        return (samemod, samepkg, depth_score, namepref)
-    
-    cands.sort(key=score, reverse=True)
-    return cands[0]
+    smod = getattr(service_type, "__module__", "") or ""
+    spkg = smod.split(".")[0]
+
+    # Aynı modüldeyse en yüksek skor
+    samemod = 100 if cmod == smod else 0
+
+    # Aynı package tree'deyse
+    samepkg = 50 if cmod.split(".")[0] == spkg else 0
+
+    # Modül derinliği benzerliği
+    depth_diff = abs(len(cmod.split(".")) - len(smod.split(".")))
+    depth_score = max(0, 20 - depth_diff * 5)
+
+    # İsim tercihi
+    namepref = 30 if name in prefs else 0
+
+    return (samemod, samepkg, depth_score, namepref)
+
+
+def _guess_lazy_impl(service_type: Type):
+    """
+    Import etmeden, sadece indeksteki statik bilgiyle implementation seç.
+    (sınıf adı, modül adı, dosya yolu) döner; aday yoksa None.
+    """
+    cands = _guess_lazy_candidates(service_type)
+    return cands[0] if cands else None
+
+
+def _guess_lazy_candidates(service_type: Type) -> list:
+    """İndeksteki somut adaylar, skora göre sıralı: (sınıf adı, modül adı, dosya yolu)"""
+    index = _discovery_index()
+    cands = [c[:3] for c in index.candidate_classes(service_type) if not c[3]]
+    cands.sort(key=lambda c: _candidate_score(c[0], c[1], service_type), reverse=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_candidate_scores(service_type, [(c[0], c[1]) for c in cands])
+    return cands
 
 
 T = TypeVar('T')
 
+
+def _type_name(service_type: Any) -> str:
+    """Hata mesajları için tip adı (Lazy[T] gibi generic alias'larda da çalışır)"""
+    if get_origin(service_type) is not None:
+        return repr(service_type)
+    return getattr(service_type, "__name__", None) or repr(service_type)
+
+
+class Lazy(Generic[T]):
+    """
+    Annotation işareti: `def __init__(self, repo: Lazy[IRepo])` parametresine gerçek servis yerine
+    bir LazyProxy enjekte edilir; servis ilk attribute erişiminde (o anki scope'ta) çözülür.
+    Nadiren kullanılan dalların oluşturulmasını erteler, döngüsel bağımlılıkları da kırar.
+    """
+
+
+def _building_name(key: Any) -> str:
+    """compile sırasındaki derleme zinciri anahtarının adı (List[T] kenarları (list, T) olarak tutulur)"""
+    if isinstance(key, tuple):
+        return f"List[{_type_name(key[1])}]"
+    return _type_name(key)
+
+
+class Provider(Generic[T]):
+    """
+    Annotation işareti: `def __init__(self, make: Provider[IService])` parametresine, her çağrıda
+    IService'in kayıtlı ömrüne göre örnek döndüren hazır bir factory enjekte edilir.
+    `Callable[[], IService]` annotation'ı da aynı şekilde ele alınır.
+    """
+
+
+def _provider_target(annotation: Any) -> Optional[Type]:
+    """Provider[T] veya Callable[[], T] annotation'ından T; değilse None"""
+    origin = get_origin(annotation)
+    if origin is Provider:
+        return get_args(annotation)[0]
+    if origin is collections.abc.Callable:
+        args = get_args(annotation)
+        if len(args) == 2 and args[0] == []:
+            return args[1]
+    return None
+
+
+class LazyProxy:
+    """
+    Hedef servisi ilk kullanımda container'dan çözen ve sonra ona yönlenen hafif vekil.
+    Attribute erişimi, çağrı ve yaygın dunder'lar (==, hash, len, iter, in, [], str, with) hedefe iletilir;
+    isinstance(proxy, T) hedefin sınıfına bakar (servisi çözer). type(proxy) yine LazyProxy'dir.
+    """
+    __slots__ = ("_lazy_container", "_lazy_service_type", "_lazy_instance")
+
+    def __init__(self, container: 'Container', service_type: Type):
+        object.__setattr__(self, "_lazy_container", container)
+        object.__setattr__(self, "_lazy_service_type", service_type)
+        object.__setattr__(self, "_lazy_instance", _EMPTY)
+
+    def _lazy_resolve(self) -> Any:
+        instance = object.__getattribute__(self, "_lazy_instance")
+        if instance is _EMPTY:
+            container = object.__getattribute__(self, "_lazy_container")
+            instance = container.resolve(object.__getattribute__(self, "_lazy_service_type"))
+            object.__setattr__(self, "_lazy_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._lazy_resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._lazy_resolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self._lazy_resolve())
+
+    @property
+    def __class__(self):
+        # isinstance(proxy, T) type(proxy)'den sonra __class__'a bakar
+        return type(self._lazy_resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._lazy_resolve() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self._lazy_resolve() != other
+
+    def __hash__(self) -> int:
+        return hash(self._lazy_resolve())
+
+    def __len__(self) -> int:
+        return len(self._lazy_resolve())
+
+    def __iter__(self):
+        return iter(self._lazy_resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._lazy_resolve()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._lazy_resolve()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._lazy_resolve()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self._lazy_resolve()[key]
+
+    def __enter__(self):
+        return self._lazy_resolve().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._lazy_resolve().__exit__(exc_type, exc_val, exc_tb)
+
+    def __str__(self) -> str:
+        return str(self._lazy_resolve())
+
+    def __repr__(self) -> str:
+        instance = object.__getattribute__(self, "_lazy_instance")
+        if instance is _EMPTY:
+            return f"<LazyProxy {_type_name(object.__getattribute__(self, '_lazy_service_type'))} (çözülmedi)>"
+        return repr(instance)
+
+
 class LifetimeScope(Enum):
     SINGLETON = 1
     SCOPED = 2
     TRANSIENT = 3
+    POOLED = 4  # scope başına havuzdan ödünç alınır, scope dispose edilince havuza iade edilir
+
+
+class ForkPolicy(Enum):
+    """Pre-fork (gunicorn tarzı) çalışmada SINGLETON'ın fork sonrası davranışı"""
+    SHARED = 1  # fork öncesi oluşturulabilir, worker'larla copy-on-write paylaşılır (salt okunur kullanım)
+    REBUILD = 2  # socket/kilit/thread tutanlar: her çocuk süreçte fork sonrası yeniden oluşturulur
+
+
+class ObjectPool:
+    """
+    POOLED servisler için sınırlı, thread-safe nesne havuzu.
+    min_size: boşta bekletmede korunacak en az instance; max_size: aynı anda var olabilecek en fazla instance.
+    idle_timeout: bu kadar saniye boşta kalan (min_size üstündeki) instance dispose edilir.
+    validate: ödünç verilmeden önce çağrılır; False dönerse instance atılıp yenisine geçilir.
+    borrow_timeout: havuz doluyken beklenecek en uzun süre (None: sınırsız).
+    """
+    def __init__(self, create: Callable[[], Any], min_size: int = 0, max_size: int = 10,
+                 idle_timeout: Optional[float] = None, validate: Optional[Callable[[Any], bool]] = None,
+                 borrow_timeout: Optional[float] = None):
+        self.create = create
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.validate = validate
+        self.borrow_timeout = borrow_timeout
+        self._idle: deque = deque()  # (instance, iade zamanı); sağ uç en son iade edilen
+        self._size = 0  # yaşayan (boşta + ödünçte + oluşturulmakta) instance sayısı
+        self._cond = threading.Condition()
+        self.created = 0
+        self.borrowed = 0
+        self.returned = 0
+        self.evicted = 0
+        self.waits = 0
+
+    def borrow(self, block: bool = True) -> Any:
+        """Boştaki bir instance'ı ver ya da yenisini oluştur; havuz doluysa bekle (block=False ise _EMPTY döner)"""
+        with self._cond:
+            deadline = None
+            while True:
+                self._evict_idle()
+                while self._idle:
+                    instance, _ = self._idle.pop()
+                    if self.validate is not None and not self.validate(instance):
+                        self._discard(instance)
+                        continue
+                    self.borrowed += 1
+                    return instance
+                if self._size < self.max_size:
+                    self._size += 1  # yer ayır; oluşturma kilit dışında yapılır
+                    break
+                if not block:
+                    return _EMPTY
+                self.waits += 1
+                if self.borrow_timeout is not None:
+                    deadline = deadline or time.monotonic() + self.borrow_timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        raise TimeoutError(f"Havuz dolu (max_size={self.max_size})")
+                else:
+                    self._cond.wait()
+        return self._create_borrowed()
+
+    def _create_borrowed(self) -> Any:
+        try:
+            instance = self.create()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.created += 1
+            self.borrowed += 1
+        return instance
+
+    def release(self, instance: Any) -> None:
+        """Ödünç alınan instance'ı havuza iade et"""
+        with self._cond:
+            self.returned += 1
+            self._idle.append((instance, time.monotonic()))
+            self._evict_idle()
+            self._cond.notify()
+
+    def fill(self) -> None:
+        """Havuzu min_size'a kadar önceden doldur"""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size or self._size >= self.max_size:
+                    return
+                self._size += 1
+            instance = self._create_borrowed()
+            with self._cond:
+                self.borrowed -= 1
+                self._idle.append((instance, time.monotonic()))
+                self._cond.notify()
+
+    def _evict_idle(self) -> None:
+        """Kilit alınmışken çağrılır: min_size üstünde, idle_timeout'u dolmuş instance'ları at"""
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            instance, _ = self._idle.popleft()
+            self._discard(instance)
+
+    def _discard(self, instance: Any) -> None:
+        self._size -= 1
+        self.evicted += 1
+        self._cond.notify()
+        if hasattr(instance, 'dispose') and callable(instance.dispose):
+            instance.dispose()
+
+    def reset_after_fork(self) -> None:
+        """Çocuk süreçte: ebeveynin instance'larını (ve olası tutulu kilidi) bırakıp boş havuzla başla"""
+        self._idle = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self.created = self.borrowed = self.returned = self.evicted = self.waits = 0
+
+    def close(self) -> None:
+        """Boştaki tüm instance'ları dispose et"""
+        with self._cond:
+            while self._idle:
+                self._discard(self._idle.popleft()[0])
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self._size,
+                "idle": idle,
+                "in_use": self._size - idle,
+                "created": self.created,
+                "borrowed": self.borrowed,
+                "returned": self.returned,
+                "evicted": self.evicted,
+                "waits": self.waits,
+            }
 
 
 class ServiceRegistration:
+    __slots__ = ("service_type", "implementation_type", "factory", "scope", "instance", "plan",
+                 "lazy_target", "lock", "pending", "slot", "pool", "fork_policy", "build_in_process",
+                 "is_instance")
+
     def __init__(self, service_type: Type, implementation_type: Optional[Type] = None,
                  factory: Optional[Callable] = None, scope: LifetimeScope = LifetimeScope.TRANSIENT):
         self.service_type = service_type
@@ -214,39 +871,555 @@ class ServiceRegistration:
         self.factory = factory
         self.scope = scope
         self.instance = None  # sadece SINGLETON için kullanılacak
+        self.plan: Optional['ActivationPlan'] = None  # ilk oluşturmada derlenir
+        self.lazy_target = None  # lazy keşifte (sınıf adı, modül adı, dosya); ilk resolve'da yüklenir
+        self.lock = threading.RLock()  # SINGLETON'ın tek seferlik oluşturulması için
+        self.pending = None  # resolve_async'te oluşturulmakta olan SINGLETON task'ı
+        self.slot = -1  # container'a kayıtta atanır; scope içindeki instance dizisinin indeksi
+        self.pool: Optional[ObjectPool] = None  # sadece POOLED için; ilk kullanımda oluşturulur
+        self.fork_policy = ForkPolicy.SHARED  # sadece SINGLETON için; fork sonrası yeniden oluşturulacak mı
+        # True ise yapıcı ayrı bir süreçte (ProcessPoolExecutor) çalışır; bağımlılıklar burada çözülüp pickle'lanır
+        self.build_in_process = False
+        self.is_instance = False  # register_instance kaydı: instance dışarıdan verildi, yeniden oluşturulamaz
+
+
+class ActivationPlan:
+    """Bir registration için bir kez çıkarılan oluşturma planı (bağımlılıklar ve varsayılanlar)"""
+    __slots__ = ("factory", "implementation_type", "is_async", "dependencies")
+
+    def __init__(self, registration: ServiceRegistration, dependencies: Optional[list] = None):
+        self.factory = registration.factory
+        self.implementation_type = registration.implementation_type
+        # async factory'ler sadece resolve_async ile çözülebilir
+        self.is_async = inspect.iscoroutinefunction(self.factory)
+        # (parametre adı, annotation, varsayılan değer) listesi; snapshot'tan geliyorsa introspection yapılmaz
+        self.dependencies = dependencies if dependencies is not None else []
+
+        if dependencies is None and self.factory is None and hasattr(self.implementation_type, '__init__'):
+            sig = inspect.signature(self.implementation_type.__init__)
+            for param_name, param in list(sig.parameters.items())[1:]:
+                if param.annotation != inspect.Parameter.empty:
+                    self.dependencies.append((param_name, param.annotation, param.default))
+
+
+_EMPTY = object()  # scope dizisinde henüz oluşturulmamış slot
 
 
 class ScopeManager:
-    def __init__(self):
-        self.scoped_instances: Dict[Type, Any] = {}
+    """
+    Scope'un instance deposu: Dict[Type, Any] yerine registration slot'uyla indekslenen liste.
+    Liste ilk kullanımda ve sadece gereken slot'a kadar büyütülür.
+    """
+    __slots__ = ("instances", "_order", "_lock", "_pending", "_leases")
+
+    def __init__(self, thread_safe: bool = True):
+        self.instances: list = []
+        self._order: list = []  # dispose sırası için oluşturulma sırasındaki slot'lar
+        # Aynı scope içinde iç içe oluşturma (scoped -> scoped) için reentrant
+        self._lock = threading.RLock() if thread_safe else None
+        self._pending: Optional[Dict[int, asyncio.Future]] = None  # async oluşturulmakta olanlar
+        self._leases: Optional[Dict[int, tuple]] = None  # POOLED: slot -> (havuz, ödünç alınan instance)
 
     def get_or_create_instance(self, registration: ServiceRegistration, container) -> Any:
-        if registration.service_type not in self.scoped_instances:
-            self.scoped_instances[registration.service_type] = container._create_instance(registration)
-        return self.scoped_instances[registration.service_type]
+        return self.get_or_create(registration.slot, container._create_instance, registration)
+
+    def get_or_create(self, slot: int, create: Callable, *args) -> Any:
+        """Instance varsa kilitsiz döner; yoksa double-checked locking ile bir kez oluşturur"""
+        instances = self.instances
+        if slot < len(instances):
+            instance = instances[slot]
+            if instance is not _EMPTY:
+                return instance
+        if self._lock is None:
+            return self._create(slot, create, args)
+        with self._lock:
+            if slot < len(instances) and instances[slot] is not _EMPTY:
+                return instances[slot]
+            return self._create(slot, create, args)
+
+    def _create(self, slot: int, create: Callable, args: tuple) -> Any:
+        instance = create(*args)
+        self._store(slot, instance)
+        return instance
+
+    def _store(self, slot: int, instance: Any) -> None:
+        instances = self.instances
+        if slot >= len(instances):
+            instances.extend([_EMPTY] * (slot + 1 - len(instances)))
+        instances[slot] = instance
+        self._order.append(slot)
+
+    def get_or_borrow(self, slot: int, pool: ObjectPool) -> Any:
+        """POOLED: scope başına bir kez havuzdan ödünç al; scope dispose edilince iade edilir"""
+        leases = self._leases
+        if leases is not None:
+            lease = leases.get(slot)
+            if lease is not None:
+                return lease[1]
+        if self._lock is None:
+            return self._borrow(slot, pool)
+        with self._lock:
+            if self._leases is not None and slot in self._leases:
+                return self._leases[slot][1]
+            return self._borrow(slot, pool)
+
+    def _borrow(self, slot: int, pool: ObjectPool) -> Any:
+        instance = pool.borrow()
+        if self._leases is None:
+            self._leases = {}
+        self._leases[slot] = (pool, instance)
+        return instance
+
+    async def get_or_borrow_async(self, slot: int, pool: ObjectPool) -> Any:
+        """
+        get_or_borrow'un async karşılığı: havuz doluysa bekleme bir executor thread'inde yapılır,
+        böylece instance'ı iade edecek diğer task'lar aynı event loop'ta çalışmaya devam eder.
+        """
+        leases = self._leases
+        if leases is not None and slot in leases:
+            return leases[slot][1]
+        instance = pool.borrow(block=False)
+        if instance is _EMPTY:
+            future = asyncio.get_running_loop().run_in_executor(None, pool.borrow)
+            try:
+                instance = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Bekleyen task iptal edildi: thread'deki ödünç alma bitince instance havuza geri verilir
+                future.add_done_callback(lambda f: f.cancelled() or f.exception() is not None or
+                                         pool.release(f.result()))
+                raise
+        if self._leases is None:
+            self._leases = {}
+        elif slot in self._leases:
+            # Beklerken aynı scope'taki başka bir task ödünç aldı
+            pool.release(instance)
+            return self._leases[slot][1]
+        self._leases[slot] = (pool, instance)
+        return instance
+
+    def _release_leases(self) -> None:
+        leases, self._leases = self._leases, None
+        if leases:
+            for pool, instance in leases.values():
+                pool.release(instance)
+
+    def get(self, slot: int) -> Any:
+        """Slot'taki instance; yoksa _EMPTY"""
+        instances = self.instances
+        return instances[slot] if slot < len(instances) else _EMPTY
+
+    async def get_or_create_async(self, slot: int, create: Callable, *args) -> Any:
+        """Async karşılığı: aynı anda gelen istekler tek bir oluşturma task'ını bekler"""
+        instance = self.get(slot)
+        if instance is not _EMPTY:
+            return instance
+        pending = self._pending
+        if pending is None:
+            pending = self._pending = {}
+        task = pending.get(slot)
+        if task is None:
+            task = pending[slot] = asyncio.ensure_future(self._create_async(slot, create, args, pending))
+        return await asyncio.shield(task)
+
+    async def _create_async(self, slot: int, create: Callable, args: tuple, pending: dict) -> Any:
+        try:
+            instance = await create(*args)
+            if self._pending is not pending:
+                # Oluşturma sürerken scope dispose edildi (ve havuzdan başka bir isteğe verilmiş olabilir):
+                # sonuç depoya yazılmaz, sadece bekleyenlere döner
+                return instance
+            existing = self.get(slot)
+            if existing is not _EMPTY:
+                return existing
+            self._store(slot, instance)
+            return instance
+        finally:
+            pending.pop(slot, None)
+
+    def _take_instances(self) -> list:
+        """Oluşturulma sırasıyla instance'ları al ve depoyu boşalt (liste boyutu tekrar kullanım için korunur)"""
+        instances = self.instances
+        taken = []
+        for slot in self._order:
+            taken.append(instances[slot])
+            instances[slot] = _EMPTY
+        self._order.clear()
+        self._pending = None
+        return taken
+
+    async def dispose_async(self):
+        """Instance'ları kapat: varsa await aclose(), yoksa dispose() (awaitable ise beklenir)"""
+        for instance in self._take_instances():
+            aclose = getattr(instance, 'aclose', None)
+            if callable(aclose):
+                await aclose()
+            elif hasattr(instance, 'dispose') and callable(instance.dispose):
+                result = instance.dispose()
+                if inspect.isawaitable(result):
+                    await result
+        self._release_leases()
 
     def dispose(self):
-        for instance in self.scoped_instances.values():
-            if hasattr(instance, 'dispose') and callable(instance.dispose):
-                instance.dispose()
-        self.scoped_instances.clear()
+        if self._lock is None:
+            self._dispose_instances()
+            return
+        with self._lock:
+            self._dispose_instances()
+
+    def _dispose_instances(self):
+        try:
+            for instance in self._take_instances():
+                if hasattr(instance, 'dispose') and callable(instance.dispose):
+                    instance.dispose()
+        finally:
+            self._release_leases()
+
+
+class AmbientScopePolicy:
+    """
+    Scope dışındaki resolve'ların otomatik oluşturduğu ambient scope için sınırlar.
+    max_instances: tutulacak en fazla instance (aşılınca en az yakın zamanda kullanılan dispose edilir).
+        Scope'taki başka bir instance'ın bağımlılığı olanlar düşürülmez; bu yüzden değer tek bir
+        çözümleme grafiğindeki SCOPED servis sayısından küçükse sınır geçici olarak aşılır.
+    ttl: saniye cinsinden ömür (süresi dolan instance, ona bağımlı scoped instance'larla birlikte
+        bir sonraki erişimde dispose edilip yeniden oluşturulur)
+    """
+    __slots__ = ("max_instances", "ttl")
+
+    def __init__(self, max_instances: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_instances = max_instances
+        self.ttl = ttl
+
+
+class BoundedScopeManager(ScopeManager):
+    """
+    AmbientScopePolicy'ye göre LRU/TTL ile instance'ları düşüren ve dispose eden ScopeManager.
+    Bir instance oluşturulurken bu scope'tan alınan instance'lar onun bağımlılığı olarak kaydedilir:
+    LRU sadece bağımlısı olmayanları düşürür, TTL ile düşen bir instance bağımlılarını da düşürür.
+    """
+    __slots__ = ("policy", "_meta", "_building", "_deps", "_dependents")
+
+    def __init__(self, policy: AmbientScopePolicy, thread_safe: bool = True):
+        super().__init__(thread_safe)
+        self.policy = policy
+        self._meta: 'OrderedDict[int, float]' = OrderedDict()  # slot -> oluşturulma zamanı, LRU sırasıyla
+        self._building: list = []  # oluşturulmakta olan slot'lar (iç içe)
+        self._deps: Dict[int, set] = {}  # slot -> bağımlı olduğu slot'lar
+        self._dependents: Dict[int, set] = {}  # slot -> ona bağımlı slot'lar
+
+    def get(self, slot: int) -> Any:
+        instance = super().get(slot)
+        if instance is _EMPTY:
+            return instance
+        ttl = self.policy.ttl
+        if ttl is not None and time.monotonic() - self._meta[slot] > ttl:
+            self._evict(slot)
+            return _EMPTY
+        self._meta.move_to_end(slot)
+        self._note_use(slot)
+        return instance
+
+    def get_or_create(self, slot: int, create: Callable, *args) -> Any:
+        # LRU sırası her erişimde değiştiği için kilitsiz hızlı yol yok
+        if self._lock is None:
+            instance = self.get(slot)
+            return instance if instance is not _EMPTY else self._create(slot, create, args)
+        with self._lock:
+            instance = self.get(slot)
+            return instance if instance is not _EMPTY else self._create(slot, create, args)
+
+    def _create(self, slot: int, create: Callable, args: tuple) -> Any:
+        self._building.append(slot)
+        try:
+            instance = create(*args)
+        finally:
+            self._building.pop()
+        self._store(slot, instance)
+        self._note_use(slot)
+        return instance
+
+    def _note_use(self, slot: int) -> None:
+        """Bir instance oluşturulurken kullanılan slot'u onun bağımlılığı olarak kaydet"""
+        if self._building:
+            parent = self._building[-1]
+            if parent != slot:
+                self._deps.setdefault(parent, set()).add(slot)
+                self._dependents.setdefault(slot, set()).add(parent)
+
+    def _store(self, slot: int, instance: Any) -> None:
+        super()._store(slot, instance)
+        self._meta[slot] = time.monotonic()
+        max_instances = self.policy.max_instances
+        while max_instances is not None and len(self._meta) > max_instances:
+            victim = next((s for s in self._meta
+                           if s != slot and s not in self._building and not self._dependents.get(s)), None)
+            if victim is None:
+                break  # kalanların hepsi canlı instance'ların bağımlılığı: sınır geçici olarak aşılır
+            self._evict(victim)
+
+    def _evict(self, slot: int) -> None:
+        """Instance'ı ve (varsa) ona bağımlı instance'ları depodan çıkarıp dispose et"""
+        for dependent in list(self._dependents.pop(slot, ())):
+            if dependent in self._meta:
+                self._evict(dependent)
+        for dep in self._deps.pop(slot, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(slot)
+        instance = self.instances[slot]
+        self.instances[slot] = _EMPTY
+        del self._meta[slot]
+        self._order.remove(slot)
+        if hasattr(instance, 'dispose') and callable(instance.dispose):
+            instance.dispose()
+
+    def _take_instances(self) -> list:
+        self._meta.clear()
+        self._deps.clear()
+        self._dependents.clear()
+        return super()._take_instances()
+
+
+class ServiceStats:
+    """Bir servis için resolve/oluşturma sayaçları ve oluşturma süresi histogramı"""
+    # Histogram kova üst sınırları (saniye): 10µs, 100µs, 1ms, 10ms, 100ms, 1s, üstü
+    BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, float("inf"))
+
+    def __init__(self):
+        self.resolves = 0
+        self.constructions = 0
+        self.cache_hits = 0  # SINGLETON/SCOPED için oluşturma gerektirmeyen resolve'lar
+        self.max_depth = 0
+        self.total_construction_time = 0.0
+        self.histogram = [0] * len(self.BUCKETS)
+
+    def record_construction(self, duration: float) -> None:
+        self.constructions += 1
+        self.total_construction_time += duration
+        for i, bound in enumerate(self.BUCKETS):
+            if duration <= bound:
+                self.histogram[i] += 1
+                break
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "resolves": self.resolves,
+            "constructions": self.constructions,
+            "cache_hits": self.cache_hits,
+            "max_depth": self.max_depth,
+            "total_construction_time": self.total_construction_time,
+            "histogram": dict(zip(self.BUCKETS, self.histogram)),
+        }
+
+
+class InstrumentationEvent:
+    """Callback'lere iletilen olay: kind 'resolve' ya da 'construct'"""
+    def __init__(self, kind: str, service_type: Type, depth: int,
+                 duration: Optional[float] = None, cache_hit: bool = False):
+        self.kind = kind
+        self.service_type = service_type
+        self.depth = depth
+        self.duration = duration
+        self.cache_hit = cache_hit
+
+
+class Instrumentation:
+    """
+    Container'ın resolve ve _create_instance'ını saran ölçüm katmanı.
+    Kapalıyken container'da hiçbir ek kod çalışmaz: sarmalayıcılar sadece açıkken instance'a takılır.
+    """
+    def __init__(self, callbacks=()):
+        self.callbacks = list(callbacks)
+        self.stats: Dict[Type, ServiceStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stats_for(self, service_type: Type) -> ServiceStats:
+        stats = self.stats.get(service_type)
+        if stats is None:
+            with self._lock:
+                stats = self.stats.setdefault(service_type, ServiceStats())
+        return stats
+
+    def snapshot(self) -> Dict[Type, Dict[str, Any]]:
+        with self._lock:
+            return {service_type: stats.as_dict() for service_type, stats in self.stats.items()}
+
+    def _emit(self, event: InstrumentationEvent) -> None:
+        for callback in self.callbacks:
+            callback(event)
+
+    def install(self, container: 'Container') -> None:
+        resolve = Container.resolve.__get__(container)
+        create_instance = Container._create_instance.__get__(container)
+        local = self._local
+        registrations = container.registrations
+
+        def instrumented_resolve(service_type):
+            registration = registrations.get(service_type)
+            if registration is None:
+                return resolve(service_type)
+            stats = self.stats_for(service_type)
+            depth = getattr(local, "depth", 0) + 1
+            local.depth = depth
+            before = stats.constructions
+            try:
+                return resolve(service_type)
+            finally:
+                local.depth = depth - 1
+                stats.resolves += 1
+                if depth > stats.max_depth:
+                    stats.max_depth = depth
+                cache_hit = (registration.scope != LifetimeScope.TRANSIENT and
+                             stats.constructions == before)
+                if cache_hit:
+                    stats.cache_hits += 1
+                if self.callbacks:
+                    self._emit(InstrumentationEvent("resolve", service_type, depth, cache_hit=cache_hit))
+
+        def instrumented_create_instance(registration):
+            start = time.perf_counter()
+            instance = create_instance(registration)
+            duration = time.perf_counter() - start
+            self.stats_for(registration.service_type).record_construction(duration)
+            if self.callbacks:
+                self._emit(InstrumentationEvent("construct", registration.service_type,
+                                                getattr(local, "depth", 0), duration=duration))
+            return instance
+
+        container.resolve = instrumented_resolve
+        container._create_instance = instrumented_create_instance
+
+    @staticmethod
+    def uninstall(container: 'Container') -> None:
+        container.__dict__.pop("resolve", None)
+        container.__dict__.pop("_create_instance", None)
+
+
+class _ResolutionState(threading.local):
+    """Thread başına çözümleme zinciri: oluşturulmakta olan kayıt -> None (ekleme sıralı)"""
+
+    def __init__(self):
+        self.stack: Dict[ServiceRegistration, None] = {}
+
+
+class ValidationReport:
+    """validate() sonucu: eksik bağımlılıklar, döngüler ve captive (singleton'a hapsolan) bağımlılıklar"""
+
+    def __init__(self):
+        self.missing: List[str] = []  # "Servis.parametre: Annotation"
+        self.cycles: List[List[str]] = []  # ["A", "B", "A"]
+        self.captive: List[str] = []  # "Singleton -> Scoped (SCOPED)"
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.cycles or self.captive)
+
+    def __str__(self) -> str:
+        lines = [f"Eksik bağımlılık: {item}" for item in self.missing]
+        lines += [f"Döngüsel bağımlılık: {' -> '.join(cycle)}" for cycle in self.cycles]
+        lines += [f"Captive bağımlılık: {item}" for item in self.captive]
+        return "\n".join(lines) or "Sorun bulunamadı"
+
+
+class CircularDependencyError(ValueError):
+    """Çözümleme sırasında bir servis kendi oluşturma zincirinde tekrar istendiğinde fırlatılır"""
+
+    def __init__(self, path: List[str]):
+        super().__init__(f"Döngüsel bağımlılık: {' -> '.join(path)}. Döngüyü kırmak için bağımlılıklardan "
+                         f"birini Lazy[T] ya da Provider[T] olarak enjekte edin")
+        self.path = path
+
+
+class ContainerValidationError(ValueError):
+    """validate() sorun bulduğunda fırlatılır; ayrıntılar report'ta"""
+
+    def __init__(self, report: ValidationReport):
+        super().__init__(f"Container doğrulaması başarısız:\n{report}")
+        self.report = report
+
+
+def _construct_in_process(implementation_type: Type, kwargs: Dict[str, Any]) -> Any:
+    """ProcessPoolExecutor worker'ında çalışır: servisi oluşturur, sonuç pickle ile geri gönderilir"""
+    return implementation_type(**kwargs)
+
+
+# os.register_at_fork ile çocuk süreçte sıfırlanacak container'lar
+_fork_aware_containers: "weakref.WeakSet[Container]" = weakref.WeakSet()
+
+
+def _reset_containers_after_fork() -> None:
+    for container in list(_fork_aware_containers):
+        try:
+            container._after_fork_in_child()
+        except Exception:
+            # Bir container'ın hatası diğerlerinin sıfırlanmasını engellemesin
+            logger.exception("Fork sonrası container sıfırlanamadı")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_containers_after_fork)
 
 
 class Container:
-    def __init__(self, strict_interfaces: bool = False, auto_discover: bool = True):
+    SNAPSHOT_VERSION = 1  # export_snapshot dosya formatı
+
+    def __init__(self, strict_interfaces: bool = False, auto_discover: bool = True,
+                 lazy_discovery: bool = False, thread_safe: bool = True, scope_pool_size: int = 0,
+                 ambient_scope_policy: Optional[AmbientScopePolicy] = None):
         self.registrations: Dict[Type, ServiceRegistration] = {}
-        self.current_scope: Optional[ScopeManager] = None
+        self._slots: Dict[Type, int] = {}  # servis tipi -> scope instance dizisindeki indeks
+        # with scope: thread ve asyncio task başına ayrı (contextvars), böylece eşzamanlı istekler
+        # birbirinin scope'unu ezmez
+        self._current_scope_var: contextvars.ContextVar[Optional[ScopeManager]] = \
+            contextvars.ContextVar("current_scope_var", default=None)
         self.strict_interfaces = strict_interfaces
+        # True ise modüller önceden import edilmez; implementation'lar AST indeksinden seçilir
+        # ve sadece seçilen modül ilk resolve'da yüklenir
+        self.lazy_discovery = lazy_discovery
+        # True ise SINGLETON/SCOPED oluşturma registration/scope kilitleriyle tek seferliktir;
+        # instance oluştuktan sonra resolve kilit almaz
+        self.thread_safe = thread_safe
+        # > 0 ise dispose edilen Scope'lar (ve instance depoları) bu sayıya kadar havuzda tutulup yeniden kullanılır
+        self.scope_pool_size = scope_pool_size
+        self._scope_pool: list = []
+        # Verilirse scope dışında otomatik oluşan ambient scope sınırlı tutulur (uzun ömürlü worker'lar için)
+        self.ambient_scope_policy = ambient_scope_policy
+        # compile() sonrası service_type -> hazır factory; kayıt değişince None'a döner
+        self._compiled: Optional[Dict[Type, Callable[[], Any]]] = None
+        # add_implementation ile birden çok implementation'ı olan servisler (kayıt sırasıyla)
+        self._implementations: Dict[Type, List[ServiceRegistration]] = {}
+        # Provider[T] / Callable[[], T] için T'nin tek başına derlenmiş factory'si; kayıt değişince boşalır
+        self._providers: Dict[Type, Callable[[], Any]] = {}
+        self._instrumentation: Optional[Instrumentation] = None
+        # Döngü tespiti: thread başına oluşturulmakta olan kayıtlar (sıralı dict, O(1) üyelik);
+        # async yolda aynı zincir task'lara kopyalanan bir ContextVar tuple'ında tutulur
+        self._resolving = _ResolutionState()
+        _fork_aware_containers.add(self)
+        # build_in_process singleton'lar için warm_up/prefork süresince paylaşılan süreç havuzu
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._resolving_async: contextvars.ContextVar[tuple] = \
+            contextvars.ContextVar("resolving_async", default=())
+        # Async bekleme grafiği: {bekleyen kayıt: {beklenen kayıt: bekleme sayısı}}; eşzamanlı çözümlemelerin
+        # birbirinin oluşturma task'ını beklemesiyle oluşan döngüleri bulmak için
+        self._async_waits: Dict[ServiceRegistration, Dict[ServiceRegistration, int]] = {}
         
         # Ambient scope
         self._ambient_scope_var: contextvars.ContextVar[Optional[ScopeManager]] = \
             contextvars.ContextVar("ambient_scope_var", default=None)
         
         # Auto discovery
-        if auto_discover:
-            print(f"🔍 Derin modül keşfi başlatılıyor...")
+        if auto_discover and lazy_discovery:
+            logger.info("Modül indeksi hazırlanıyor (lazy)")
+            start = time.perf_counter()
+            index = _discovery_index()
+            logger.info("%d modül indekslendi (%.1f ms)", len(index.entries),
+                        (time.perf_counter() - start) * 1000)
+        elif auto_discover:
+            logger.info("Derin modül keşfi başlatılıyor")
+            start = time.perf_counter()
             count = _deep_module_discovery()
-            print(f"✅ {count} modül yüklendi")
+            logger.info("%d modül yüklendi (%.1f ms)", count, (time.perf_counter() - start) * 1000)
     #***********yalnız kullanımda bu kod bloğu mecburi******************
     @classmethod
     def provider(cls, service_type: Type[T]) -> T:
@@ -260,38 +1433,173 @@ class Container:
         Servisi container'a kaydet
         Geriye dönük uyumluluk için orijinal method imzası korundu
         """
-        if implementation_type is None:
-            if inspect.isabstract(service_type) or (
-                hasattr(service_type, '__abstractmethods__') and 
-                service_type.__abstractmethods__):
-                
-                print(f"🔎 {service_type.__name__} için implementation aranıyor...")
+        implementation_type, lazy_target = self._choose_implementation(service_type, implementation_type)
+        registration = ServiceRegistration(
+            service_type=service_type,
+            implementation_type=implementation_type,
+            scope=scope
+        )
+        registration.lazy_target = lazy_target
+        self._set_registration(registration)
+
+    def _choose_implementation(self, service_type: Type, implementation_type: Optional[Type]) -> tuple:
+        """
+        register kuralları: implementation verilmemişse soyut servis için tahmin edilir (lazy_discovery'de
+        sadece (sınıf adı, modül adı, dosya) hedefi), somut servis kendisine kaydedilir (strict modda hata).
+        (implementation_type, lazy_target) döndürür.
+        """
+        if implementation_type is not None:
+            return implementation_type, None
+        if inspect.isabstract(service_type) or (
+            hasattr(service_type, '__abstractmethods__') and 
+            service_type.__abstractmethods__):
+            
+            logger.debug("%s için implementation aranıyor", service_type.__name__)
+            if self.lazy_discovery:
+                target = _guess_lazy_impl(service_type)
+                if target is not None:
+                    logger.info("Bulunan implementation (lazy): %s -> %s.%s",
+                                service_type.__name__, target[1], target[0])
+                    return None, target
+
+            impl = _guess_impl(service_type)
+            
+            if impl is None:
+                # Son bir kez daha derin keşif yap (indeksi tazeleyerek)
+                _deep_module_discovery(force=True)
                 impl = _guess_impl(service_type)
                 
                 if impl is None:
-                    # Son bir kez daha derin keşif yap
-                    _deep_module_discovery()
-                    impl = _guess_impl(service_type)
-                    
-                    if impl is None:
-                        raise ValueError(f"Otomatik implementation bulunamadı: {service_type.__name__}")
-                
-                implementation_type = impl
-                print(f"✅ Bulunan implementation: {implementation_type.__name__}")
+                    raise ValueError(f"Otomatik implementation bulunamadı: {service_type.__name__}")
+            
+            logger.info("Bulunan implementation: %s -> %s",
+                        service_type.__name__, impl.__name__)
+            return impl, None
+        if self.strict_interfaces:
+            raise TypeError(f"Somut tip kaydedilemez (strict mod): {service_type.__name__}")
+        return service_type, None
+
+    def register_many(self, services, scope: LifetimeScope = LifetimeScope.TRANSIENT) -> Dict[Type, Any]:
+        """
+        Birden çok servisi tek keşif geçişiyle toplu kaydet.
+        services: tip listesi, (tip, LifetimeScope) ya da (tip, implementation, LifetimeScope) tuple'ları,
+        {tip: LifetimeScope} dict'i veya bir modül/package (içinde tanımlı soyut sınıflar `scope` ile kaydedilir).
+        Bulunamayan implementation'lar tek bir ValueError'da (strict modda somut tipler register gibi
+        TypeError'da) raporlanır ve bu durumda hiçbir kayıt yapılmaz;
+        belirsiz (eşit skorlu) eşleşmeler birlikte raporlanır ve en iyi aday seçilir.
+        Seçilen implementation'ları {servis: implementation} olarak döndürür
+        (lazy_discovery modunda implementation yerine (sınıf adı, modül adı, dosya yolu)).
+        """
+        entries = []
+        for item in self._expand_services(services):
+            if isinstance(item, tuple):
+                if len(item) == 2:
+                    entries.append((item[0], None, item[1]))
+                else:
+                    entries.append(item)
             else:
-                if self.strict_interfaces:
-                    raise TypeError(f"Somut tip kaydedilemez (strict mod): {service_type.__name__}")
-                implementation_type = service_type
+                entries.append((item, None, scope))
 
-        self.registrations[service_type] = ServiceRegistration(
-            service_type=service_type,
-            implementation_type=implementation_type,
-            scope=scope
-        )
+        # Tek keşif geçişi: modüller bir kez yüklenir, sınıf indeksi bir kez tazelenir
+        if not self.lazy_discovery:
+            _deep_module_discovery()
+            _implementation_index.refresh()
 
-    def register_singleton(self, service_type: Type, implementation_type: Type = None) -> None:
-        """Singleton olarak kaydet - orijinal method"""
+        resolved, missing, ambiguous, concrete = [], [], [], []
+        for service_type, implementation_type, service_scope in entries:
+            lazy_target = None
+            if implementation_type is None:
+                if inspect.isabstract(service_type) or getattr(service_type, '__abstractmethods__', None):
+                    if self.lazy_discovery:
+                        cands = _guess_lazy_candidates(service_type)
+                        score = lambda c: _candidate_score(c[0], c[1], service_type)
+                        describe = lambda c: f"{c[1]}.{c[0]}"
+                    else:
+                        cands = _guess_candidates(service_type, discover=False)
+                        score = lambda c: _candidate_score(c.__name__, getattr(c, "__module__", "") or "",
+                                                           service_type)
+                        describe = lambda c: f"{c.__module__}.{c.__name__}"
+                    if not cands:
+                        missing.append(service_type.__name__)
+                        continue
+                    tied = [c for c in cands if score(c) == score(cands[0])]
+                    if len(tied) > 1:
+                        ambiguous.append(f"{service_type.__name__} -> {', '.join(describe(c) for c in tied)}")
+                    if self.lazy_discovery:
+                        lazy_target = cands[0]
+                    else:
+                        implementation_type = cands[0]
+                elif self.strict_interfaces:
+                    concrete.append(service_type.__name__)
+                    continue
+                else:
+                    implementation_type = service_type
+            resolved.append((service_type, implementation_type, service_scope, lazy_target))
+
+        if ambiguous:
+            logger.warning("Belirsiz eşleşmeler (en yüksek skorlu seçildi):\n  %s", "\n  ".join(ambiguous))
+        if concrete:
+            raise TypeError(f"Somut tip kaydedilemez (strict mod): {', '.join(concrete)}")
+        if missing:
+            raise ValueError(f"Otomatik implementation bulunamadı: {', '.join(missing)}")
+
+        chosen = {}
+        for service_type, implementation_type, service_scope, lazy_target in resolved:
+            registration = ServiceRegistration(
+                service_type=service_type,
+                implementation_type=implementation_type,
+                scope=service_scope
+            )
+            registration.lazy_target = lazy_target
+            self._set_registration(registration)
+            chosen[service_type] = implementation_type or lazy_target
+        logger.info("%d servis toplu kaydedildi", len(chosen))
+        return chosen
+
+    @staticmethod
+    def _expand_services(services):
+        """register_many girdisini (tip | tuple) listesine çevir"""
+        if isinstance(services, dict):
+            return [(service_type, service_scope) for service_type, service_scope in services.items()]
+        if inspect.ismodule(services):
+            modules = [services]
+            if hasattr(services, '__path__'):
+                for info in pkgutil.walk_packages(services.__path__, services.__name__ + "."):
+                    try:
+                        modules.append(importlib.import_module(info.name))
+                    except ImportError:
+                        continue
+            found = []
+            for mod in modules:
+                for obj in vars(mod).values():
+                    if (inspect.isclass(obj) and obj.__module__ == mod.__name__ and
+                            inspect.isabstract(obj) and obj not in found):
+                        found.append(obj)
+            return found
+        return list(services)
+
+    def register_singleton(self, service_type: Type, implementation_type: Type = None,
+                           fork_policy: ForkPolicy = ForkPolicy.SHARED, build_in_process: bool = False) -> None:
+        """
+        Singleton olarak kaydet - orijinal method
+        fork_policy: pre-fork çalışmada paylaşım/yeniden oluşturma.
+        build_in_process: saniyeler süren saf CPU kurulumları (büyük tablolar, derlenmiş kurallar) GIL'e
+        takılmadan ayrı süreçte yapılır; warm_up/prefork bunları eşzamanlı oluşturur. Implementation modül
+        seviyesinde tanımlı olmalı, bağımlılıklar ve sonuç pickle edilebilmelidir. Bağımlılıklar worker'a
+        kopyalanır: servis diğer singleton'ların kopyalarını tutar (k.resolve(Heavy).cfg is k.resolve(Cfg)
+        False olur) ve bu durumda uyarı loglanır. En iyisi bağımlılıksız, saf veri üreten servislerdir.
+        """
         self.register(service_type, implementation_type, LifetimeScope.SINGLETON)
+        registration = self.registrations[service_type]
+        registration.fork_policy = fork_policy
+        registration.build_in_process = build_in_process
+
+    def set_fork_policy(self, service_type: Type, fork_policy: ForkPolicy) -> None:
+        """Kayıtlı servisin (ör. register_factory ile SINGLETON) fork politikasını değiştir"""
+        if service_type not in self.registrations:
+            raise KeyError(f"Servis tipi kaydedilmemiş: {_type_name(service_type)}")
+        for registration in self._registrations_of(service_type):
+            registration.fork_policy = fork_policy
 
     def register_scoped(self, service_type: Type, implementation_type: Type = None) -> None:
         """Scoped olarak kaydet - orijinal method"""
@@ -301,112 +1609,1227 @@ class Container:
         """Transient olarak kaydet - orijinal method"""
         self.register(service_type, implementation_type, LifetimeScope.TRANSIENT)
 
+    def register_pooled(self, service_type: Type, implementation_type: Type = None, min_size: int = 0,
+                        max_size: int = 10, idle_timeout: Optional[float] = None,
+                        validate: Optional[Callable[[Any], bool]] = None,
+                        borrow_timeout: Optional[float] = None) -> None:
+        """
+        Havuzlu olarak kaydet: resolve scope başına havuzdan bir instance ödünç alır,
+        scope (ya da scoped_function / dispose_ambient_scope) bitince instance havuza iade edilir.
+        """
+        self.register(service_type, implementation_type, LifetimeScope.POOLED)
+        registration = self.registrations[service_type]
+        registration.pool = ObjectPool(
+            lambda: self._create_instance(registration), min_size=min_size, max_size=max_size,
+            idle_timeout=idle_timeout, validate=validate, borrow_timeout=borrow_timeout)
+
+    def pool_stats(self, service_type: Type) -> Dict[str, int]:
+        """POOLED servisin havuz istatistikleri (size, idle, in_use, created, borrowed, returned, evicted, waits)"""
+        registration = self.registrations[service_type]
+        if registration.scope != LifetimeScope.POOLED:
+            raise TypeError(f"Havuzlu servis değil: {service_type.__name__}")
+        return (registration.pool or self._pool_for(registration)).stats()
+
+    def _pool_for(self, registration: ServiceRegistration) -> ObjectPool:
+        """register(..., POOLED) ile ayarsız kaydedilenler için varsayılan havuz"""
+        with registration.lock:
+            if registration.pool is None:
+                registration.pool = ObjectPool(lambda: self._create_instance(registration))
+            return registration.pool
+
     def register_instance(self, service_type: Type, instance: Any) -> None:
         """Instance olarak kaydet - orijinal method"""
         registration = ServiceRegistration(service_type=service_type, scope=LifetimeScope.SINGLETON)
         registration.instance = instance
-        self.registrations[service_type] = registration
+        registration.is_instance = True
+        self._set_registration(registration)
 
     def register_factory(self, service_type: Type, factory: Callable, scope: LifetimeScope = LifetimeScope.TRANSIENT) -> None:
-        """Factory olarak kaydet - orijinal method"""
-        self.registrations[service_type] = ServiceRegistration(
+        """Factory olarak kaydet - orijinal method (POOLED için async factory kabul edilmez)"""
+        self._check_pooled_factory(service_type, factory, scope)
+        self._set_registration(ServiceRegistration(
             service_type=service_type,
             factory=factory,
             scope=scope
-        )
+        ))
+
+    @staticmethod
+    def _check_pooled_factory(service_type: Type, factory: Callable, scope: LifetimeScope) -> None:
+        """Havuz instance'ları senkron oluşturur (fill, borrow); async factory POOLED olarak kaydedilemez"""
+        if scope == LifetimeScope.POOLED and inspect.iscoroutinefunction(factory):
+            raise TypeError(f"{_type_name(service_type)}: POOLED servisler async factory ile kaydedilemez; "
+                            f"havuz instance'ları senkron oluşturulur")
+
+    def add_implementation(self, service_type: Type, implementation_type: Type = None,
+                           scope: LifetimeScope = LifetimeScope.TRANSIENT,
+                           factory: Optional[Callable] = None) -> None:
+        """
+        Servise ek bir implementation ekle (plugin listeleri için). register* çağrılarından farklı olarak
+        önceki kayıtları silmez: resolve_all / List[T] hepsini kayıt sırasıyla döndürür,
+        resolve ise son ekleneni çözer. register* ile yeniden kayıt listeyi tek kayda indirir.
+        factory verilmemişse implementation register'daki kurallarla seçilir (tahmin, strict mod).
+        """
+        lazy_target = None
+        if factory is None:
+            implementation_type, lazy_target = self._choose_implementation(service_type, implementation_type)
+        else:
+            self._check_pooled_factory(service_type, factory, scope)
+        implementations = self._implementations.get(service_type)
+        if implementations is None:
+            current = self.registrations.get(service_type)
+            implementations = [current] if current is not None else []
+            self._implementations[service_type] = implementations
+        registration = ServiceRegistration(service_type=service_type, implementation_type=implementation_type,
+                                           factory=factory, scope=scope)
+        registration.lazy_target = lazy_target
+        # Her implementation'ın scope içinde kendi slot'u olur
+        registration.slot = self._slots.setdefault((service_type, len(implementations)), len(self._slots))
+        implementations.append(registration)
+        self.registrations[service_type] = registration
+        self._compiled = None
+        self._providers = {}
+
+    def _registrations_of(self, service_type: Type) -> List[ServiceRegistration]:
+        """Servisin tüm implementation kayıtları (add_implementation yoksa tek kayıt)"""
+        implementations = self._implementations.get(service_type)
+        if implementations is not None:
+            return implementations
+        registration = self.registrations.get(service_type)
+        return [registration] if registration is not None else []
+
+    def _set_registration(self, registration: ServiceRegistration) -> None:
+        """Kaydı ekle/değiştir - eski kaydın derlenmiş planı onunla birlikte düşer"""
+        # Aynı servis tipi yeniden kaydedilse de slot'u korunur
+        registration.slot = self._slots.setdefault(registration.service_type, len(self._slots))
+        self.registrations[registration.service_type] = registration
+        self._implementations.pop(registration.service_type, None)
+        self._compiled = None
+        self._providers = {}
 
     def create_scope(self) -> 'Scope':
-        """Scope oluştur - orijinal method"""
+        """Scope oluştur - orijinal method (havuz açıksa dispose edilmiş bir Scope yeniden kullanılır)"""
+        if self._scope_pool:
+            try:
+                return self._scope_pool.pop()
+            except IndexError:  # başka thread son elemanı aldıysa
+                pass
         return Scope(self)
 
+    def _release_scope(self, scope: 'Scope') -> None:
+        """Dispose edilmiş (deposu boşaltılmış) Scope'u sınırı aşmıyorsa havuza iade et"""
+        if len(self._scope_pool) < self.scope_pool_size:
+            scope.previous_scope = None
+            self._scope_pool.append(scope)
+
     def resolve(self, service_type: Type[T]) -> T:
         """Servisi çöz - orijinal method"""
+        compiled = self._compiled
+        if compiled is not None:
+            factory = compiled.get(service_type)
+            if factory is not None:
+                return factory()
+
         if service_type not in self.registrations:
-            raise KeyError(f"Servis tipi kaydedilmemiş: {service_type.__name__}")
+            # Lazy[T] gibi özel annotation'lar sadece kayıt bulunamayınca ele alınır
+            getter = self._special_dependency(service_type)
+            if getter is not None:
+                return getter()
+            raise KeyError(f"Servis tipi kaydedilmemiş: {_type_name(service_type)}")
         
         registration = self.registrations[service_type]
 
         if registration.scope == LifetimeScope.SINGLETON:
-            if registration.instance is None:
-                registration.instance = self._create_instance(registration)
-            return registration.instance
+            instance = registration.instance
+            if instance is None:
+                instance = self._create_singleton(registration, self._create_instance, registration)
+            return instance
 
         elif registration.scope == LifetimeScope.SCOPED:
-            # Önce with scope kontrol et
-            scope_mgr = self.current_scope
-            # Yoksa ambient scope'a bak
-            if scope_mgr is None:
-                scope_mgr = self._ambient_scope_var.get()
-                if scope_mgr is None:
-                    # İlk kez girildiyse otomatik ambient scope oluştur
-                    scope_mgr = ScopeManager()
-                    self._ambient_scope_var.set(scope_mgr)
-            return scope_mgr.get_or_create_instance(registration, self)
+            return self._current_scope_manager().get_or_create_instance(registration, self)
+
+        elif registration.scope == LifetimeScope.POOLED:
+            return self._current_scope_manager().get_or_borrow(
+                registration.slot, registration.pool or self._pool_for(registration))
 
         else:  # TRANSIENT
             return self._create_instance(registration)
 
+    def resolve_many(self, service_types: Iterable[Type]) -> List[Any]:
+        """
+        Birden çok servisi tek çağrıda, verilen sırayla çöz. Aktif scope bir kez bulunur ve
+        tüm SCOPED/POOLED servisler için kullanılır; derlenmiş factory'ler varsa doğrudan çağrılır.
+        Ölçüm açıkken her servis resolve üzerinden çözülür (resolve sayaçları eksik kalmasın diye).
+        """
+        if self._instrumentation is not None:
+            return [self.resolve(service_type) for service_type in service_types]
+        compiled = self._compiled
+        registrations = self.registrations
+        scope_manager = None
+        results = []
+        for service_type in service_types:
+            factory = compiled.get(service_type) if compiled is not None else None
+            if factory is not None:
+                results.append(factory())
+                continue
+            registration = registrations.get(service_type)
+            if registration is None:
+                results.append(self.resolve(service_type))  # özel annotation'lar veya KeyError
+                continue
+            if scope_manager is None and registration.scope in (LifetimeScope.SCOPED, LifetimeScope.POOLED):
+                scope_manager = self._current_scope_manager()
+            results.append(self._resolve_registration(registration, scope_manager))
+        return results
+
+    def resolve_all(self, service_type: Type[T]) -> List[T]:
+        """Servisin kayıtlı tüm implementation'larını (add_implementation sırasıyla) çöz; kayıt yoksa boş liste"""
+        results = []
+        scope_manager = None
+        for registration in self._registrations_of(service_type):
+            if scope_manager is None and registration.scope in (LifetimeScope.SCOPED, LifetimeScope.POOLED):
+                scope_manager = self._current_scope_manager()
+            results.append(self._resolve_registration(registration, scope_manager))
+        return results
+
+    def _resolve_registration(self, registration: ServiceRegistration,
+                              scope_manager: Optional[ScopeManager] = None) -> Any:
+        """resolve'un ömür dağıtımı; scope deposu önceden bulunmuşsa tekrar aranmaz"""
+        if registration.scope == LifetimeScope.SINGLETON:
+            instance = registration.instance
+            if instance is None:
+                instance = self._create_singleton(registration, self._create_instance, registration)
+            return instance
+        elif registration.scope == LifetimeScope.SCOPED:
+            return (scope_manager or self._current_scope_manager()).get_or_create_instance(registration, self)
+        elif registration.scope == LifetimeScope.POOLED:
+            return (scope_manager or self._current_scope_manager()).get_or_borrow(
+                registration.slot, registration.pool or self._pool_for(registration))
+        else:  # TRANSIENT
+            return self._create_instance(registration)
+
+    @property
+    def current_scope(self) -> Optional[ScopeManager]:
+        """Mevcut context'te (thread/task) aktif with scope'unun deposu"""
+        return self._current_scope_var.get()
+
+    @current_scope.setter
+    def current_scope(self, scope_manager: Optional[ScopeManager]) -> None:
+        self._current_scope_var.set(scope_manager)
+
+    def _current_scope_manager(self) -> ScopeManager:
+        """Aktif scope'u bul: önce with scope, yoksa ambient scope"""
+        scope_mgr = self._current_scope_var.get()
+        if scope_mgr is None:
+            scope_mgr = self._ambient_scope_var.get()
+            if scope_mgr is None:
+                # İlk kez girildiyse otomatik ambient scope oluştur
+                if self.ambient_scope_policy is not None:
+                    scope_mgr = BoundedScopeManager(self.ambient_scope_policy, self.thread_safe)
+                else:
+                    scope_mgr = ScopeManager(self.thread_safe)
+                self._ambient_scope_var.set(scope_mgr)
+        return scope_mgr
+
+    def dispose_ambient_scope(self) -> None:
+        """Mevcut context'in otomatik ambient scope'unu dispose et (ör. worker döngüsünün her turu sonunda)"""
+        scope_mgr = self._ambient_scope_var.get()
+        if scope_mgr is not None:
+            self._ambient_scope_var.set(None)
+            scope_mgr.dispose()
+
+    def _create_singleton(self, registration: ServiceRegistration, create: Callable, *args) -> Any:
+        """SINGLETON'ı tam bir kez oluştur (thread_safe modda registration kilidiyle double-checked)"""
+        if not self.thread_safe:
+            instance = registration.instance = create(*args)
+            return instance
+        with registration.lock:
+            instance = registration.instance
+            if instance is None:
+                instance = registration.instance = create(*args)
+            return instance
+
     def _create_instance(self, registration: ServiceRegistration) -> Any:
         """Instance oluştur - orijinal method"""
         # SINGLETON için önceden var olan instance kullanılmalı
         if registration.scope == LifetimeScope.SINGLETON and registration.instance is not None:
             return registration.instance
 
-        if registration.factory is not None:
-            return registration.factory(self)
+        plan = registration.plan or self._plan_for(registration)
+
+        if plan.factory is None and not plan.dependencies and not registration.build_in_process:
+            return plan.implementation_type()
+
+        # Bağımlılığı olan (ya da container'ı kullanabilen factory'li) kayıtlar zincire eklenir
+        stack = self._resolving.stack
+        if registration in stack:
+            raise CircularDependencyError(self._cycle_path(list(stack), registration))
+        stack[registration] = None
+        try:
+            if plan.factory is not None:
+                if plan.is_async:
+                    raise TypeError(self._async_factory_message(registration))
+                return plan.factory(self)
 
-        implementation_type = registration.implementation_type
-        if hasattr(implementation_type, '__init__'):
-            sig = inspect.signature(implementation_type.__init__)
             constructor_params = {}
-            for param_name, param in list(sig.parameters.items())[1:]:
-                if param.annotation != inspect.Parameter.empty:
-                    try:
-                        constructor_params[param_name] = self.resolve(param.annotation)
-                    except KeyError:
-                        if param.default != inspect.Parameter.empty:
-                            constructor_params[param_name] = param.default
-                        else:
-                            raise ValueError(
-                                f"'{param_name}' parametresi için servis bulunamadı: {param.annotation}"
-                            )
-            return implementation_type(**constructor_params)
-        return implementation_type()
+            for param_name, annotation, default in plan.dependencies:
+                try:
+                    constructor_params[param_name] = self.resolve(annotation)
+                except KeyError:
+                    if default is not inspect.Parameter.empty:
+                        constructor_params[param_name] = default
+                    else:
+                        raise ValueError(
+                            f"'{param_name}' parametresi için servis bulunamadı: {annotation}"
+                        )
+            if registration.build_in_process:
+                return self._build_in_process(registration, constructor_params)
+            return plan.implementation_type(**constructor_params)
+        finally:
+            del stack[registration]
+
+    def _build_in_process(self, registration: ServiceRegistration, kwargs: Dict[str, Any]) -> Any:
+        """Yapıcıyı ayrı süreçte çalıştır: warm_up/prefork sırasında ortak havuz, yoksa tek seferlik bir süreç"""
+        plan = registration.plan or self._plan_for(registration)
+        implementation_type = plan.implementation_type
+        # Bağımlılıklar worker'a pickle ile kopyalanır: servis container'daki nesneleri değil kopyalarını tutar
+        injected = [name for name, _, default in plan.dependencies if kwargs.get(name, default) is not default]
+        if injected:
+            logger.warning("%s ayrı süreçte oluşturuluyor; enjekte edilen %s kopyalanır, container'daki "
+                           "instance'larla aynı nesne olmaz", self._describe_registration(registration),
+                           ", ".join(injected))
+        executor = self._process_pool
+        if executor is not None:
+            return executor.submit(_construct_in_process, implementation_type, kwargs).result()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_construct_in_process, implementation_type, kwargs).result()
+
+    def _cycle_path(self, chain: list, registration: ServiceRegistration) -> List[str]:
+        """Zincirdeki kayıt'tan başlayıp ona geri dönen döngü yolu: ["A", "B", "A"]"""
+        cycle = chain[chain.index(registration):] + [registration]
+        return [self._describe_registration(r) for r in cycle]
+
+    @staticmethod
+    def _async_factory_message(registration: ServiceRegistration) -> str:
+        return (f"{registration.service_type.__name__} async factory ile kaydedilmiş; "
+                f"resolve_async kullanılmalı")
+
+    async def resolve_async(self, service_type: Type[T]) -> T:
+        """
+        Servisi async çöz: async factory'ler await edilir, yapıcı bağımlılıkları
+        asyncio.gather ile eşzamanlı çözülür. SINGLETON/SCOPED aynı anda istense de bir kez oluşturulur.
+        """
+        if service_type not in self.registrations:
+            getter = self._special_dependency(service_type)
+            if getter is not None:
+                return getter()
+            raise KeyError(f"Servis tipi kaydedilmemiş: {_type_name(service_type)}")
+
+        return await self._resolve_registration_async(self.registrations[service_type])
+
+    async def _resolve_registration_async(self, registration: ServiceRegistration) -> Any:
+        """resolve_async'in ömür dağıtımı (warm_up_async add_implementation kayıtlarını da buradan oluşturur)"""
+        # Zincirde zaten varsa beklenen task kendisini bekleyeceği için kilitlenmeden önce hata ver
+        chain = self._resolving_async.get()
+        if chain and registration in chain:
+            raise CircularDependencyError(self._cycle_path(list(chain), registration))
+
+        if registration.scope == LifetimeScope.SINGLETON:
+            instance = registration.instance
+            if instance is not None:
+                return instance
+            task = registration.pending
+            if task is None:
+                task = registration.pending = asyncio.ensure_future(self._create_singleton_async(registration))
+            return await self._await_building(chain, registration, task)
+
+        elif registration.scope == LifetimeScope.SCOPED:
+            scope_manager = self._current_scope_manager()
+            instance = scope_manager.get(registration.slot)
+            if instance is not _EMPTY:
+                return instance
+            return await self._await_building(chain, registration, scope_manager.get_or_create_async(
+                registration.slot, self._create_instance_async, registration))
+
+        elif registration.scope == LifetimeScope.POOLED:
+            return await self._current_scope_manager().get_or_borrow_async(
+                registration.slot, registration.pool or self._pool_for(registration))
+
+        else:  # TRANSIENT
+            return await self._create_instance_async(registration)
+
+    async def _await_building(self, chain: tuple, registration: ServiceRegistration, awaitable) -> Any:
+        """
+        Zincirdeki son kaydın ihtiyaç duyduğu registration'ın (belki başka bir çözümlemenin başlattığı)
+        oluşturulmasını bekle. Bekleme süresince zincir kenarları bekleme grafiğine yazılır; registration
+        grafikte bu zincire geri ulaşıyorsa iki çözümleme birbirini bekleyecektir: kilitlenmek yerine hata ver.
+        awaitable paylaşılan bir task ise beklerken iptal edilmemesi için shield ile sarılır.
+        """
+        if chain:
+            cycle = self._async_wait_cycle(chain, registration)
+            if cycle is not None:
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+                raise CircularDependencyError(cycle)
+        if isinstance(awaitable, asyncio.Future):
+            awaitable = asyncio.shield(awaitable)
+        if not chain:
+            return await awaitable
+        waits = self._async_waits
+        edges = list(zip(chain, chain[1:] + (registration,)))
+        for waiter, target in edges:
+            targets = waits.setdefault(waiter, {})
+            targets[target] = targets.get(target, 0) + 1
+        try:
+            return await awaitable
+        finally:
+            for waiter, target in edges:
+                targets = waits.get(waiter)
+                if targets is not None:
+                    count = targets.get(target, 0) - 1
+                    if count > 0:
+                        targets[target] = count
+                    else:
+                        targets.pop(target, None)
+                        if not targets:
+                            waits.pop(waiter, None)
+
+    def _async_wait_cycle(self, chain: tuple, registration: ServiceRegistration) -> Optional[List[str]]:
+        """Bekleme grafiğinde registration'dan zincirdeki bir kayda giden yol varsa döngü yolu, yoksa None"""
+        waits = self._async_waits
+        if not waits:
+            return None
+        in_chain = set(chain)
+        parents = {registration: None}
+        stack = [registration]
+        while stack:
+            current = stack.pop()
+            for target in list(waits.get(current, ())):
+                if target in parents:
+                    continue
+                parents[target] = current
+                if target in in_chain:
+                    path, node = [], current
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    return self._cycle_path(list(chain) + path[::-1], target)
+                stack.append(target)
+        return None
+
+    async def _create_singleton_async(self, registration: ServiceRegistration) -> Any:
+        try:
+            instance = await self._create_instance_async(registration)
+            if registration.instance is None:
+                registration.instance = instance
+            return registration.instance
+        finally:
+            registration.pending = None
+
+    async def _create_instance_async(self, registration: ServiceRegistration) -> Any:
+        """_create_instance'ın async karşılığı"""
+        if registration.scope == LifetimeScope.SINGLETON and registration.instance is not None:
+            return registration.instance
+
+        plan = registration.plan or self._plan_for(registration)
+
+        if plan.factory is not None:
+            result = plan.factory(self)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        if not plan.dependencies and not registration.build_in_process:
+            return plan.implementation_type()
+
+        # gather'ın task'ları context'i kopyaladığı için zincir alt bağımlılıklara da görünür
+        token = self._resolving_async.set(self._resolving_async.get() + (registration,))
+        try:
+            # Birbirinden bağımsız bağımlılıkların (ör. I/O bekleyen singleton'lar) gecikmeleri örtüşür
+            values = await asyncio.gather(*(
+                self._resolve_dependency_async(param_name, annotation, default)
+                for param_name, annotation, default in plan.dependencies
+            ))
+        finally:
+            self._resolving_async.reset(token)
+        constructor_params = {name: value for (name, _, _), value in zip(plan.dependencies, values)}
+        if registration.build_in_process:
+            # Süreçteki oluşturma beklenirken event loop bloklanmaz
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._build_in_process, registration, constructor_params)
+        return plan.implementation_type(**constructor_params)
+
+    async def _resolve_dependency_async(self, param_name: str, annotation: Any, default: Any) -> Any:
+        try:
+            return await self.resolve_async(annotation)
+        except KeyError:
+            if default is not inspect.Parameter.empty:
+                return default
+            raise ValueError(f"'{param_name}' parametresi için servis bulunamadı: {annotation}")
+
+    def enable_instrumentation(self, *callbacks: Callable[[InstrumentationEvent], None]) -> Instrumentation:
+        """
+        resolve ve _create_instance için ölçümü aç: servis başına resolve/oluşturma/cache-hit sayaçları,
+        oluşturma süresi histogramı ve çözümleme derinliği. Her olay callback'lere de iletilir.
+        Derlenmiş factory'ler hook'ları atlayacağı için düşürülür; ölçüm async yolu kapsamaz.
+        resolve_all ve List[T] enjeksiyonu implementation bazında çözdüğü için sadece oluşturmalar sayılır,
+        resolve sayaçlarına girmez.
+        """
+        self.disable_instrumentation()
+        self._instrumentation = Instrumentation(callbacks)
+        self._compiled = None
+        self._providers = {}
+        self._instrumentation.install(self)
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Ölçümü kapat - resolve tekrar sarmalayıcısız orijinal methoda döner"""
+        if self._instrumentation is not None:
+            self._instrumentation.uninstall(self)
+            self._instrumentation = None
+
+    def instrumentation_snapshot(self) -> Dict[Type, Dict[str, Any]]:
+        """Servis başına sayaçların kopyası; ölçüm kapalıysa boş"""
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.snapshot()
+
+    def warm_up(self, max_workers: Optional[int] = None) -> Dict[Type, float]:
+        """
+        Tüm SINGLETON'ları ilk istekten önce oluştur.
+        Kayıtlardan singleton bağımlılık grafiği çıkarılır; bağımlılıkları hazır olan singleton'lar
+        thread pool'da eşzamanlı oluşturulur. Async factory'li singleton'lar için warm_up_async kullanılmalı.
+        Ardından min_size'ı olan POOLED havuzları doldurulur.
+        {servis: oluşturma süresi (sn)} döndürür.
+        """
+        timings = self._build_singletons(max_workers)
+        self._fill_pools()
+        return timings
+
+    def prefork(self, max_workers: Optional[int] = None) -> Dict[Type, float]:
+        """
+        Ebeveyn süreçte fork'tan hemen önce çağrılır: sadece ForkPolicy.SHARED singleton'lar oluşturulur,
+        böylece ağır kurulum worker'lar arasında copy-on-write paylaşılır. REBUILD olanlar ve onlara
+        (dolaylı) bağımlı singleton'lar oluşturulmaz; havuzlar doldurulmaz (her süreç kendi havuzunu açar).
+        """
+        rebuild = self._fork_rebuild_set()
+        return self._build_singletons(max_workers, lambda registration: registration not in rebuild)
+
+    def _fork_rebuild_set(self) -> set:
+        """
+        Fork sonrası yeniden oluşturulması gereken singleton kayıtları: REBUILD olanlar ve onlara (dolaylı)
+        bağımlılar. A -> B -> C zincirinde sadece C REBUILD ise A ve B de eklenir (küme değişmeyene kadar).
+        """
+        singletons = [r for t in list(self.registrations) for r in self._registrations_of(t)
+                      if r.scope == LifetimeScope.SINGLETON and not r.is_instance]
+        rebuild = {r for r in singletons if r.fork_policy == ForkPolicy.REBUILD}
+        if not rebuild:
+            return set()
+        rebuild_types = {r.service_type for r in rebuild}
+        remaining = {r: self._singleton_dependencies(r) for r in singletons if r not in rebuild}
+        changed = True
+        while changed:
+            changed = False
+            for registration, deps in list(remaining.items()):
+                if deps & rebuild_types:
+                    rebuild.add(registration)
+                    rebuild_types.add(registration.service_type)
+                    del remaining[registration]
+                    changed = True
+        return rebuild
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Çocuk süreçte (os.register_at_fork) çağrılır: fork anında başka thread'lerin tuttuğu kilitler
+        yenilenir, scope durumu ve havuzlar boşaltılır, ardından REBUILD singleton'lar sıfırlanır.
+        Kilitler/havuzlar önce yenilenir: rebuild kümesi plan derleyip lazy hedefleri import edebilir ve
+        hata verse bile container kullanılabilir kalır.
+        """
+        for service_type in list(self.registrations):
+            for registration in self._registrations_of(service_type):
+                registration.lock = threading.RLock()
+                registration.pending = None
+                if registration.pool is not None:
+                    registration.pool.reset_after_fork()
+        self._ambient_scope_var.set(None)
+        self._scope_pool = []
+        self._resolving = _ResolutionState()
+        self._async_waits = {}
+        self._process_pool = None  # ebeveynin worker süreçleri çocukta kullanılamaz
+        current = self._current_scope_var.get()
+        if current is not None and current._lock is not None:
+            current._lock = threading.RLock()
+        if self._instrumentation is not None:
+            self._instrumentation._lock = threading.Lock()
+        rebuild = self._fork_rebuild_set()
+        for registration in rebuild:
+            registration.instance = None
+        logger.debug("Fork sonrası container sıfırlandı (%d singleton yeniden oluşturulacak)", len(rebuild))
+
+    def _singleton_graph(self, include: Optional[Callable[[ServiceRegistration], bool]] = None,
+                         with_async: bool = False) -> Tuple[Dict[ServiceRegistration, set],
+                                                            Dict[ServiceRegistration, list]]:
+        """
+        Oluşturulacak singleton kayıtları (add_implementation ile eklenenler dahil) ve aralarındaki kenarlar:
+        ({kayıt: beklediği kayıtlar}, {kayıt: ona bağımlı kayıtlar}). Sadece bu turda oluşturulacaklara
+        olan kenarlar beklenir.
+        """
+        pending: Dict[ServiceRegistration, set] = {}
+        for service_type in list(self.registrations):
+            for registration in self._registrations_of(service_type):
+                if registration.scope != LifetimeScope.SINGLETON or registration.instance is not None:
+                    continue
+                if include is not None and not include(registration):
+                    continue
+                plan = registration.plan or self._plan_for(registration)
+                if plan.is_async and not with_async:
+                    continue
+                pending[registration] = self._singleton_dependencies(registration)
+
+        waiting_on: Dict[ServiceRegistration, set] = {}
+        dependents: Dict[ServiceRegistration, list] = {}
+        for registration, dep_types in pending.items():
+            deps = waiting_on[registration] = set()
+            for dep_type in dep_types:
+                dep = self.registrations.get(dep_type)
+                if dep in pending and dep is not registration:
+                    deps.add(dep)
+                    dependents.setdefault(dep, []).append(registration)
+        return waiting_on, dependents
+
+    def _record_warm_up(self, registration: ServiceRegistration, elapsed: float,
+                        timings: Dict[Type, float]) -> None:
+        """Oluşturma süresini logla; aynı servisin birden çok implementation'ı varsa süreler toplanır"""
+        timings[registration.service_type] = timings.get(registration.service_type, 0.0) + elapsed
+        logger.info("%s hazırlandı (%.1f ms)", self._describe_registration(registration), elapsed * 1000)
+
+    def _build_singletons(self, max_workers: Optional[int] = None,
+                          include: Optional[Callable[[ServiceRegistration], bool]] = None) -> Dict[Type, float]:
+        """warm_up/prefork ortak adımı: (include'a uyan) singleton'ları bağımlılık sırasıyla eşzamanlı oluştur"""
+        waiting_on, dependents = self._singleton_graph(include)
+        timings: Dict[Type, float] = {}
+
+        def build(registration):
+            start = time.perf_counter()
+            self._resolve_registration(registration)
+            return registration, time.perf_counter() - start
+
+        # build_in_process singleton'lar ortak süreç havuzuna gönderilir; thread'ler sonucu beklerken
+        # GIL'i bıraktığı için birden çok süreçte eşzamanlı oluşturulurlar
+        in_process = sum(1 for r in waiting_on if r.build_in_process)
+        owns_process_pool = in_process > 0 and self._process_pool is None
+        if owns_process_pool:
+            self._process_pool = ProcessPoolExecutor(max_workers=min(in_process, os.cpu_count() or 1))
+        built = set()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                ready = [r for r, deps in waiting_on.items() if not deps]
+                submitted = set(ready)
+                running = {executor.submit(build, r) for r in ready}
+                while running:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        registration, elapsed = future.result()
+                        built.add(registration)
+                        self._record_warm_up(registration, elapsed, timings)
+                        for dependent in self._release_dependents(registration, waiting_on, dependents,
+                                                                  submitted):
+                            running.add(executor.submit(build, dependent))
+        finally:
+            if owns_process_pool:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+        # Döngüye takılıp hiç hazır hale gelmeyenler sırayla çözülür (hata resolve'dan yükselir)
+        for registration in waiting_on:
+            if registration not in built:
+                self._record_warm_up(*build(registration), timings)
+        return timings
+
+    @staticmethod
+    def _release_dependents(registration: ServiceRegistration, waiting_on: Dict[ServiceRegistration, set],
+                            dependents: Dict[ServiceRegistration, list], submitted: set) -> list:
+        """Biten kaydı bekleyenlerden düş; bütün bağımlılıkları hazır hale gelenleri döndür"""
+        ready = []
+        for dependent in dependents.get(registration, ()):
+            waiting_on[dependent].discard(registration)
+            if not waiting_on[dependent] and dependent not in submitted:
+                submitted.add(dependent)
+                ready.append(dependent)
+        return ready
+
+    def _fill_pools(self) -> None:
+        """min_size'ı olan POOLED havuzlarını doldur"""
+        for service_type in list(self.registrations):
+            for registration in self._registrations_of(service_type):
+                if registration.scope == LifetimeScope.POOLED and registration.pool is not None:
+                    registration.pool.fill()
+
+    async def warm_up_async(self) -> Dict[Type, float]:
+        """
+        warm_up'ın async karşılığı: singleton'lar (async factory'liler dahil) aynı bağımlılık grafiğine göre,
+        bağımlılıkları hazır olanlar eşzamanlı task'lar olarak oluşturulur; ardından havuzlar doldurulur.
+        """
+        waiting_on, dependents = self._singleton_graph(with_async=True)
+        timings: Dict[Type, float] = {}
+
+        async def build(registration):
+            start = time.perf_counter()
+            await self._resolve_registration_async(registration)
+            return registration, time.perf_counter() - start
+
+        built = set()
+        ready = [r for r, deps in waiting_on.items() if not deps]
+        submitted = set(ready)
+        running = {asyncio.ensure_future(build(r)) for r in ready}
+        try:
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    registration, elapsed = task.result()
+                    built.add(registration)
+                    self._record_warm_up(registration, elapsed, timings)
+                    for dependent in self._release_dependents(registration, waiting_on, dependents, submitted):
+                        running.add(asyncio.ensure_future(build(dependent)))
+        finally:
+            for task in running:
+                task.cancel()
+
+        # Döngüye takılanlar sırayla çözülür (CircularDependencyError resolve_async'ten yükselir)
+        for registration in waiting_on:
+            if registration not in built:
+                self._record_warm_up(*await build(registration), timings)
+        # Havuz instance'ları senkron oluşturulur; event loop bloklanmasın diye thread'de
+        await asyncio.get_running_loop().run_in_executor(None, self._fill_pools)
+        return timings
+
+    def _singleton_dependencies(self, registration: ServiceRegistration) -> set:
+        """Registration'ın (SCOPED/TRANSIENT ara düğümler üzerinden) ulaştığı SINGLETON servisler"""
+        found, visited = set(), set()
+        stack = [registration]
+        while stack:
+            current = stack.pop()
+            plan = current.plan or self._plan_for(current)
+            for _, annotation, _ in plan.dependencies:
+                dep = self.registrations.get(annotation)
+                if dep is None or annotation in visited:
+                    continue
+                visited.add(annotation)
+                if dep.scope == LifetimeScope.SINGLETON:
+                    found.add(annotation)
+                else:
+                    stack.append(dep)
+        return found
+
+    def validate(self, raise_on_error: bool = True) -> ValidationReport:
+        """
+        Hiçbir servisi oluşturmadan tüm kayıtların bağımlılık grafiğini tek geçişte çıkar ve raporla:
+        eksik kayıtlar, döngüler (Lazy/Provider kenarları döngü oluşturmaz) ve SCOPED/TRANSIENT/POOLED
+        bir servise bağımlı SINGLETON'lar. raise_on_error ise sorun varsa ContainerValidationError fırlatır.
+        """
+        report = ValidationReport()
+        graph: Dict[ServiceRegistration, list] = {}
+        for service_type in list(self.registrations):
+            for registration in self._registrations_of(service_type):
+                edges = graph[registration] = []
+                if registration.is_instance:  # register_instance: kurucu çağrılmaz, bağımlılığı yok
+                    continue
+                plan = registration.plan or self._plan_for(registration)
+                for param_name, annotation, default in plan.dependencies:
+                    targets, eager = self._dependency_targets(annotation)
+                    if targets is None:
+                        if default is inspect.Parameter.empty:
+                            report.missing.append(f"{self._describe_registration(registration)}.{param_name}: "
+                                                  f"{_type_name(annotation)}")
+                        continue
+                    if not eager:
+                        continue
+                    edges.extend(targets)
+                    if registration.scope == LifetimeScope.SINGLETON:
+                        for target in targets:
+                            if target.scope != LifetimeScope.SINGLETON:
+                                report.captive.append(f"{self._describe_registration(registration)} -> "
+                                                      f"{self._describe_registration(target)} ({target.scope.name})")
+
+        # Recursive olmayan DFS: 1 = yolda (ziyaret ediliyor), 2 = bitti
+        state: Dict[ServiceRegistration, int] = {}
+        seen_cycles = set()
+        for root in graph:
+            if root in state:
+                continue
+            state[root] = 1
+            path, iterators = [root], [iter(graph[root])]
+            while iterators:
+                target = next(iterators[-1], None)
+                if target is None:
+                    state[path.pop()] = 2
+                    iterators.pop()
+                elif target not in state:
+                    state[target] = 1
+                    path.append(target)
+                    iterators.append(iter(graph.get(target, ())))
+                elif state[target] == 1:
+                    cycle = path[path.index(target):] + [target]
+                    key = frozenset(cycle)
+                    if key not in seen_cycles:
+                        seen_cycles.add(key)
+                        report.cycles.append([self._describe_registration(r) for r in cycle])
+
+        logger.info("Doğrulama: %d kayıt, %d eksik, %d döngü, %d captive", len(graph),
+                    len(report.missing), len(report.cycles), len(report.captive))
+        if raise_on_error and not report.ok:
+            raise ContainerValidationError(report)
+        return report
+
+    def _dependency_targets(self, annotation: Any) -> Tuple[Optional[List[ServiceRegistration]], bool]:
+        """
+        Bir parametre annotation'ının bağlandığı kayıtlar ve kenarın oluşturma anında çözülüp çözülmediği.
+        Karşılığı yoksa (None, ...). Lazy[T] / Provider[T] kenarları ertelenmiştir (False).
+        """
+        registration = self.registrations.get(annotation)
+        if registration is not None:
+            return [registration], True
+        origin = get_origin(annotation)
+        target = get_args(annotation)[0] if origin is Lazy else _provider_target(annotation)
+        if target is not None:
+            registration = self.registrations.get(target)
+            return ([registration] if registration is not None else None), False
+        if origin is list:
+            args = get_args(annotation)
+            if len(args) == 1 and args[0] in self.registrations:
+                return self._registrations_of(args[0]), True
+        return None, True
+
+    def _describe_registration(self, registration: ServiceRegistration) -> str:
+        """Raporlar için kayıt adı; çoklu implementation'larda implementation da yazılır"""
+        name = _type_name(registration.service_type)
+        if len(self._implementations.get(registration.service_type, ())) > 1:
+            name += f"[{_type_name(registration.implementation_type)}]"
+        return name
+
+    def compile(self) -> None:
+        """
+        Tüm kayıtları bağımlılıkları gömülü hazır factory'lere derle.
+        Sonrasında resolve recursive resolve/_create_instance zinciri yerine sadece dict'e bakar.
+        Herhangi bir register* çağrısı derlenmiş factory'leri geçersiz kılar.
+        Ölçüm (enable_instrumentation) açıkken derleme yapılmaz.
+        """
+        if self._instrumentation is not None:
+            return
+        compiled: Dict[Type, Callable[[], Any]] = {}
+        building: Dict[Any, None] = {}
+        for service_type in list(self.registrations):
+            self._compile_service(service_type, compiled, building)
+        self._compiled = compiled
+
+    def _compile_service(self, service_type: Type, compiled: Dict[Type, Callable[[], Any]],
+                         building: Dict[Any, None]) -> Callable[[], Any]:
+        factory = compiled.get(service_type)
+        if factory is not None:
+            return factory
+        if service_type in building:
+            # Döngüsel bağımlılık: bu kenar her çözümlemede döngüye gireceği için hata olarak derlenir
+            chain = list(building)
+            path = [_building_name(key) for key in chain[chain.index(service_type):]]
+            path.append(_type_name(service_type))
+
+            def cycle():
+                raise CircularDependencyError(path)
+            return cycle
+
+        building[service_type] = None
+        try:
+            factory = self._compile_registration(self.registrations[service_type], compiled, building)
+        finally:
+            building.pop(service_type, None)
+        compiled[service_type] = factory
+        return factory
+
+    def _compile_registration(self, registration: ServiceRegistration,
+                              compiled: Dict[Type, Callable[[], Any]],
+                              building: Dict[Any, None]) -> Callable[[], Any]:
+        """Tek bir kaydı ömrüne uygun hazır factory'ye derle"""
+        build = self._compile_constructor(registration, compiled, building)
+
+        if registration.scope == LifetimeScope.SINGLETON:
+            create_singleton = self._create_singleton
+
+            def factory():
+                instance = registration.instance
+                if instance is None:
+                    instance = create_singleton(registration, build)
+                return instance
+        elif registration.scope == LifetimeScope.SCOPED:
+            current_scope_manager = self._current_scope_manager
+            slot = registration.slot
+
+            def factory():
+                return current_scope_manager().get_or_create(slot, build)
+        elif registration.scope == LifetimeScope.POOLED:
+            current_scope_manager = self._current_scope_manager
+            slot = registration.slot
+            pool = registration.pool or self._pool_for(registration)
+
+            def factory():
+                return current_scope_manager().get_or_borrow(slot, pool)
+        else:  # TRANSIENT
+            factory = build
+        return factory
+
+    def _compile_constructor(self, registration: ServiceRegistration,
+                             compiled: Dict[Type, Callable[[], Any]],
+                             building: Dict[Any, None]) -> Callable[[], Any]:
+        """Registration'ın yapıcısını, bağımlılık factory'leri doğrudan çağrılacak şekilde üret"""
+        plan = registration.plan or self._plan_for(registration)
+
+        if registration.build_in_process:
+            create_instance = self._create_instance
+            return lambda: create_instance(registration)
+
+        if plan.factory is not None:
+            if plan.is_async:
+                message = self._async_factory_message(registration)
+
+                def async_only():
+                    raise TypeError(message)
+                return async_only
+            # Factory container'ı tekrar kullanabileceği için _create_instance gibi zincire eklenir
+            user_factory = plan.factory
+            resolving = self._resolving
+
+            def build_with_factory():
+                stack = resolving.stack
+                if registration in stack:
+                    raise CircularDependencyError(self._cycle_path(list(stack), registration))
+                stack[registration] = None
+                try:
+                    return user_factory(self)
+                finally:
+                    del stack[registration]
+            return build_with_factory
+
+        if not plan.dependencies:
+            return plan.implementation_type
+
+        namespace = {"impl": plan.implementation_type}
+        arguments = []
+        for index, (param_name, annotation, default) in enumerate(plan.dependencies):
+            if annotation in self.registrations:
+                getter = self._compile_service(annotation, compiled, building)
+            else:
+                getter = self._special_dependency(annotation, compiled, building)
+            if getter is None:
+                if default is not inspect.Parameter.empty:
+                    getter = (lambda value: lambda: value)(default)
+                else:
+                    getter = self._missing_dependency(param_name, annotation)
+            namespace[f"dep{index}"] = getter
+            arguments.append(f"{param_name}=dep{index}()")
+
+        # impl(a=dep0(), b=dep1()) şeklinde, parametre başına döngü olmadan çağrı üret
+        source = f"def build():\n    return impl({', '.join(arguments)})\n"
+        exec(source, namespace)
+        return namespace["build"]
+
+    def _special_dependency(self, annotation: Any, compiled: Optional[Dict[Type, Callable[[], Any]]] = None,
+                            building: Optional[Dict[Any, None]] = None) -> Optional[Callable[[], Any]]:
+        """
+        Kayıtlı olmayan özel annotation'lar için değer üreten fonksiyon; uygun değilse None.
+        Lazy[T]: T kayıtlıysa, ilk attribute erişiminde T'yi çözen LazyProxy.
+        Provider[T] / Callable[[], T]: T kayıtlıysa, T'nin derlenmiş factory'si (container'a tekrar girmez).
+        List[T]: T'nin tüm implementation'ları (resolve_all).
+        compiled/building verilirse (compile sırasında) factory o derlemeden alınır.
+        """
+        origin = get_origin(annotation)
+        if origin is Lazy:
+            target = get_args(annotation)[0]
+            if target in self.registrations or self._special_dependency(target) is not None:
+                return lambda: LazyProxy(self, target)
+            return None
+        if origin is list:
+            args = get_args(annotation)
+            if len(args) != 1 or args[0] not in self.registrations:
+                return None
+            target = args[0]
+            if compiled is None:
+                return lambda: self.resolve_all(target)
+            key = (list, target)
+            if key in building:
+                # Döngüsel bağımlılık: bu kenar klasik resolve_all yoluna bırakılır
+                return lambda: self.resolve_all(target)
+            building[key] = None
+            try:
+                factories = [self._compile_registration(registration, compiled, building)
+                             for registration in self._registrations_of(target)]
+            finally:
+                building.pop(key, None)
+            return lambda: [factory() for factory in factories]
+        target = _provider_target(annotation)
+        if target is not None and target in self.registrations:
+            if compiled is not None and target in building:
+                # Provider döngüyü kırar: derlenmekte olan hedef çağrı anında çözülür
+                provider = lambda: self.resolve(target)
+            elif compiled is not None:
+                # Ertelenmiş kenar: hedef yeni bir zincirle derlenir (atalar döngü sayılmaz)
+                provider = self._compile_service(target, compiled, {})
+            else:
+                provider = self._provider_for(target)
+            return lambda: provider
+        return None
+
+    def _provider_for(self, service_type: Type) -> Callable[[], Any]:
+        """
+        service_type için hazır factory: compile() yapılmışsa oradan, değilse sadece o servisin
+        alt ağacı derlenip önbelleğe alınır. Ölçüm açıkken factory resolve'a gider.
+        """
+        if self._instrumentation is not None:
+            return lambda: self.resolve(service_type)
+        compiled = self._compiled
+        if compiled is not None and service_type in compiled:
+            return compiled[service_type]
+        provider = self._providers.get(service_type)
+        if provider is None:
+            provider = self._compile_service(service_type, {}, {})
+            self._providers[service_type] = provider
+        return provider
+
+    @staticmethod
+    def _missing_dependency(param_name: str, annotation: Any) -> Callable[[], Any]:
+        def missing():
+            raise ValueError(f"'{param_name}' parametresi için servis bulunamadı: {annotation}")
+        return missing
+
+    def _plan_for(self, registration: ServiceRegistration) -> ActivationPlan:
+        """Registration'ın planını derle (signature introspection registration başına bir kez yapılır)"""
+        if registration.lazy_target is not None:
+            self._load_lazy_implementation(registration)
+        registration.plan = ActivationPlan(registration)
+        return registration.plan
+
+    @staticmethod
+    def _load_lazy_implementation(registration: ServiceRegistration) -> None:
+        """Lazy keşifte seçilen sınıfın modülünü şimdi yükle; indeks yanılmışsa normal tahmine dön"""
+        cls_name, module_name, py_file = registration.lazy_target
+        service_type = registration.service_type
+        try:
+            _import_module_file(module_name, Path(py_file))
+        except Exception:
+            pass
+        impl = getattr(sys.modules.get(module_name), cls_name, None)
+        if not (inspect.isclass(impl) and issubclass(impl, service_type) and not inspect.isabstract(impl)):
+            impl = _guess_impl(service_type)
+            if impl is None:
+                raise ValueError(f"Otomatik implementation bulunamadı: {service_type.__name__}")
+        registration.implementation_type = impl
+        registration.lazy_target = None
+
+    def export_snapshot(self, path) -> List[Type]:
+        """
+        Çözülmüş kayıt tablosunu (servis -> implementation/factory nitelikli adları, ömür, bağımlılık planı)
+        JSON dosyasına yaz; from_snapshot ile keşif ve tahmin yapılmadan geri yüklenir.
+        register_instance kayıtları, yerel ya da __main__'de tanımlı sınıflar ve lambda factory/havuz validate
+        fonksiyonları yazılamaz; bunlar loglanır ve yükleme sonrası tekrar kaydedilebilmeleri için
+        servis tipleri döndürülür.
+        """
+        entries, skipped = [], []
+        for service_type in list(self.registrations):
+            for index, registration in enumerate(self._registrations_of(service_type)):
+                entry = self._snapshot_entry(registration)
+                if entry is None:
+                    skipped.append(service_type)
+                    continue
+                entry["add"] = index > 0
+                entries.append(entry)
+        if skipped:
+            logger.warning("Snapshot'a yazılamayan kayıtlar: %s", ", ".join(_type_name(t) for t in skipped))
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"version": self.SNAPSHOT_VERSION, "registrations": entries},
+                                       separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+        logger.info("%d kayıt snapshot'a yazıldı: %s", len(entries), path)
+        return skipped
+
+    def _snapshot_entry(self, registration: ServiceRegistration) -> Optional[Dict[str, Any]]:
+        """Kaydın JSON karşılığı; yazılamıyorsa None"""
+        if registration.is_instance:
+            return None  # register_instance: instance'ın kendisi yazılamaz
+        service = _qualified_ref(registration.service_type)
+        if service is None:
+            return None
+        entry: Dict[str, Any] = {"service": service, "scope": registration.scope.name,
+                                 "implementation": None, "factory": None, "dependencies": None, "pool": None}
+        # Lazy keşifle kaydedilenlerin implementation'ı burada yüklenir
+        plan = registration.plan or self._plan_for(registration)
+        if plan.factory is not None:
+            entry["factory"] = _qualified_ref(plan.factory)
+            if entry["factory"] is None:
+                return None
+        else:
+            entry["implementation"] = _qualified_ref(plan.implementation_type)
+            if entry["implementation"] is None:
+                return None
+            entry["dependencies"] = self._snapshot_dependencies(plan)
+        pool = registration.pool
+        if pool is not None:
+            entry["pool"] = {"min_size": pool.min_size, "max_size": pool.max_size,
+                             "idle_timeout": pool.idle_timeout, "borrow_timeout": pool.borrow_timeout}
+            if pool.validate is not None:
+                entry["pool"]["validate"] = _qualified_ref(pool.validate)
+                if entry["pool"]["validate"] is None:
+                    return None  # lambda/yerel validate yazılamaz; sessizce düşürülmemesi için kayıt atlanır
+        if registration.fork_policy != ForkPolicy.SHARED:
+            entry["fork"] = registration.fork_policy.name
+        if registration.build_in_process:
+            entry["process"] = True
+        return entry
+
+    @staticmethod
+    def _snapshot_dependencies(plan: ActivationPlan) -> Optional[list]:
+        """Planın bağımlılıkları [ad, referans, {varsayılan}]; Lazy[T] gibi özel annotation'lar ya da
+        JSON'a yazılamayan varsayılanlar varsa None (yüklemede plan signature'dan yeniden çıkarılır)"""
+        dependencies = []
+        for param_name, annotation, default in plan.dependencies:
+            if not inspect.isclass(annotation) or get_origin(annotation) is not None:
+                return None
+            ref = _qualified_ref(annotation)
+            if ref is None:
+                return None
+            if default is inspect.Parameter.empty:
+                dependencies.append([param_name, ref])
+            elif default is None or isinstance(default, (str, int, float, bool)):
+                dependencies.append([param_name, ref, {"default": default}])
+            else:
+                return None
+        return dependencies
+
+    @classmethod
+    def from_snapshot(cls, path, **kwargs) -> 'Container':
+        """
+        export_snapshot dosyasından Container oluştur: modül taraması ve implementation tahmini yapılmaz,
+        sadece kayıtlı sınıfların modülleri import edilir. kwargs Container'a iletilir (auto_discover varsayılan False).
+        """
+        start = time.perf_counter()
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Desteklenmeyen snapshot sürümü: {data.get('version')}")
+        kwargs.setdefault("auto_discover", False)
+        container = cls(**kwargs)
+        for entry in data["registrations"]:
+            service_type = _load_qualified(entry["service"])
+            scope = LifetimeScope[entry["scope"]]
+            factory = _load_qualified(entry["factory"]) if entry["factory"] else None
+            implementation_type = _load_qualified(entry["implementation"]) if entry["implementation"] else None
+            if entry["add"]:
+                container.add_implementation(service_type, implementation_type, scope, factory)
+                registration = container.registrations[service_type]
+            else:
+                registration = ServiceRegistration(service_type=service_type, implementation_type=implementation_type,
+                                                   factory=factory, scope=scope)
+                container._set_registration(registration)
+            if entry["dependencies"] is not None:
+                dependencies = [(dep[0], _load_qualified(dep[1]),
+                                 dep[2]["default"] if len(dep) > 2 else inspect.Parameter.empty)
+                                for dep in entry["dependencies"]]
+                registration.plan = ActivationPlan(registration, dependencies)
+            registration.fork_policy = ForkPolicy[entry.get("fork", "SHARED")]
+            registration.build_in_process = entry.get("process", False)
+            if entry["pool"] is not None:
+                pool_options = dict(entry["pool"])
+                if pool_options.get("validate"):
+                    pool_options["validate"] = _load_qualified(pool_options["validate"])
+                registration.pool = ObjectPool(lambda registration=registration: container._create_instance(registration),
+                                               **pool_options)
+        logger.info("%d kayıt snapshot'tan yüklendi (%.1f ms)", len(data["registrations"]),
+                    (time.perf_counter() - start) * 1000)
+        return container
 
     def scoped_function(self, fn: Callable) -> Callable:
         """Fonksiyonları otomatik scope içine al - orijinal method"""
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if self._ambient_scope_var.get() is not None:
+                    return await fn(*args, **kwargs)
+                scope = self.create_scope()
+                self._ambient_scope_var.set(scope.scope_manager)
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    self._ambient_scope_var.set(None)
+                    await scope.scope_manager.dispose_async()
+                    if self.scope_pool_size:
+                        self._release_scope(scope)
+            return async_wrapper
+
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            mgr = self._ambient_scope_var.get()
-            created_here = False
-            if mgr is None:
-                mgr = ScopeManager()
-                self._ambient_scope_var.set(mgr)
-                created_here = True
+            if self._ambient_scope_var.get() is not None:
+                return fn(*args, **kwargs)
+            scope = self.create_scope()
+            self._ambient_scope_var.set(scope.scope_manager)
             try:
                 return fn(*args, **kwargs)
             finally:
-                if created_here:
-                    mgr.dispose()
-                    self._ambient_scope_var.set(None)
+                self._ambient_scope_var.set(None)
+                scope.scope_manager.dispose()
+                if self.scope_pool_size:
+                    self._release_scope(scope)
         return wrapper
 
 
 class Scope:
     """Scope sınıfı - orijinal yapı korundu"""
+    __slots__ = ("container", "previous_scope", "scope_manager", "_token")
+
     def __init__(self, container: Container):
         self.container = container
         self.previous_scope = None
-        self.scope_manager = ScopeManager()
+        self.scope_manager = ScopeManager(container.thread_safe)
+        self._token = None
     
     def __enter__(self):
-        self.previous_scope = self.container.current_scope
-        self.container.current_scope = self.scope_manager
+        scope_var = self.container._current_scope_var
+        self.previous_scope = scope_var.get()
+        self._token = scope_var.set(self.scope_manager)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.scope_manager.dispose()
-        self.container.current_scope = self.previous_scope
+        try:
+            self.scope_manager.dispose()
+        finally:
+            self._restore()
+        # Havuz açıksa bu Scope nesnesi çıkıştan sonra kullanılmamalı; başka bir isteğe verilebilir
+        if self.container.scope_pool_size:
+            self.container._release_scope(self)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.scope_manager.dispose_async()
+        finally:
+            self._restore()
+        if self.container.scope_pool_size:
+            self.container._release_scope(self)
+
+    def _restore(self) -> None:
+        """Bu context'te scope'u girişten önceki haline döndür"""
+        token, self._token = self._token, None
+        try:
+            self.container._current_scope_var.reset(token)
+        except ValueError:
+            # Scope başka bir context'te kapatılıyorsa token kullanılamaz
+            self.container._current_scope_var.set(self.previous_scope)
 
     def resolve(self, service_type: Type[T]) -> T:
         return self.container.resolve(service_type)
+
+    def resolve_many(self, service_types: Iterable[Type]) -> List[Any]:
+        return self.container.resolve_many(service_types)
+
+    def resolve_all(self, service_type: Type[T]) -> List[T]:
+        return self.container.resolve_all(service_type)
+
+    async def resolve_async(self, service_type: Type[T]) -> T:
+        return await self.container.resolve_async(service_type)
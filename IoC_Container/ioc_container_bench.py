@@ -0,0 +1,273 @@
+"""
+IoC Container benchmark seti.
+
+Kullanım:
+    python ioc_container_bench.py              # tüm benchmark'lar
+    python ioc_container_bench.py --quick      # kısa tekrar sayılarıyla
+    python ioc_container_bench.py --json       # satır başına bir JSON kaydı
+    python ioc_container_bench.py -k scope     # adında "scope" geçenler
+
+Çıktı formatı (sürümler arasında karşılaştırılabilir, sabit):
+    # ioc_container_bench v1 python=<sürüm>
+    <benchmark adı>\t<ns/op>\t<ops/s>
+Her ölçüm birkaç tekrarın en iyisidir.
+
+Not: dosya adında "ioc_container" geçtiği için container'ın otomatik keşfi bu dosyayı yüklemez.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ioc_container import Container, LifetimeScope, Provider
+
+FORMAT_VERSION = 1
+
+
+# ---------------------------------------------------------------- servisler
+class IService(ABC):
+    @abstractmethod
+    def process(self):
+        pass
+
+
+class Service(IService):
+    def process(self):
+        return 1
+
+
+class Leaf:
+    pass
+
+
+class ServiceMaker:
+    def __init__(self, make: Provider[IService]):
+        self.make = make
+
+
+def _make_wide(width: int):
+    """width adet bağımlılığı olan bir sınıf üret"""
+    leaves = [type(f"WideLeaf{i}", (), {}) for i in range(width)]
+    params = ", ".join(f"d{i}: WideLeaf{i}" for i in range(width))
+    namespace = {f"WideLeaf{i}": leaf for i, leaf in enumerate(leaves)}
+    exec(f"class Wide:\n    def __init__(self, {params}):\n        pass\n", namespace)
+    return leaves, namespace["Wide"]
+
+
+def _make_deep(depth: int):
+    """depth uzunluğunda bir bağımlılık zinciri üret: Deep{n} -> Deep{n-1} -> ... -> Deep0"""
+    chain = [type("Deep0", (), {})]
+    for i in range(1, depth):
+        namespace = {"Prev": chain[-1]}
+        exec(f"class Deep{i}:\n    def __init__(self, prev: Prev):\n        self.prev = prev\n", namespace)
+        chain.append(namespace[f"Deep{i}"])
+    return chain
+
+
+def _container() -> Container:
+    return Container(auto_discover=False)
+
+
+# ---------------------------------------------------------------- ölçüm
+def _measure(fn, number: int, repeat: int) -> float:
+    """fn'i number kez çalıştır, repeat turun en iyisini ns/op olarak döndür"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e9
+
+
+def _lifetime_benchmarks(compiled: bool):
+    suffix = ".compiled" if compiled else ""
+    c = _container()
+    c.register_singleton(IService, Service)
+    c.register_scoped(Leaf)
+    c.register_factory(Service, lambda _: Service(), LifetimeScope.TRANSIENT)
+    if compiled:
+        c.compile()
+    yield f"resolve.singleton{suffix}", lambda: c.resolve(IService)
+    yield f"resolve.factory{suffix}", lambda: c.resolve(Service)
+    with c.create_scope():
+        c.resolve(Leaf)
+        yield f"resolve.scoped{suffix}", lambda: c.resolve(Leaf)
+        yield f"resolve.many3{suffix}", lambda: c.resolve_many((IService, Service, Leaf))
+
+    t = _container()
+    t.register_transient(IService, Service)
+    if compiled:
+        t.compile()
+    yield f"resolve.transient{suffix}", lambda: t.resolve(IService)
+
+    t.register_singleton(ServiceMaker)
+    if compiled:
+        t.compile()
+    yield f"resolve.provider{suffix}", t.resolve(ServiceMaker).make
+
+
+def _graph_benchmarks(compiled: bool):
+    suffix = ".compiled" if compiled else ""
+    for width in (4, 16):
+        c = _container()
+        leaves, wide = _make_wide(width)
+        for leaf in leaves:
+            c.register_transient(leaf)
+        c.register_transient(wide)
+        if compiled:
+            c.compile()
+        yield f"graph.wide{width}{suffix}", lambda c=c, wide=wide: c.resolve(wide)
+
+    for depth in (4, 16):
+        c = _container()
+        chain = _make_deep(depth)
+        for node in chain:
+            c.register_transient(node)
+        if compiled:
+            c.compile()
+        yield f"graph.deep{depth}{suffix}", lambda c=c, top=chain[-1]: c.resolve(top)
+
+
+def _scope_benchmarks():
+    c = _container()
+    c.register_scoped(Leaf)
+
+    def churn():
+        with c.create_scope() as scope:
+            scope.resolve(Leaf)
+    yield "scope.create_dispose", churn
+
+    pooled = Container(auto_discover=False, scope_pool_size=8)
+    pooled.register_scoped(Leaf)
+
+    def pooled_churn():
+        with pooled.create_scope() as scope:
+            scope.resolve(Leaf)
+    yield "scope.create_dispose.pooled", pooled_churn
+
+    @c.scoped_function
+    def handler():
+        return None
+    yield "scope.scoped_function", handler
+
+    @c.scoped_function
+    def handler_resolve():
+        return c.resolve(Leaf)
+    yield "scope.scoped_function_resolve", handler_resolve
+
+
+def _micro_benchmarks(names_filter, number: int, repeat: int):
+    groups = [
+        _lifetime_benchmarks(False), _lifetime_benchmarks(True),
+        _graph_benchmarks(False), _graph_benchmarks(True),
+        _scope_benchmarks(),
+    ]
+    for group in groups:
+        for name, fn in group:
+            if names_filter and names_filter not in name:
+                continue
+            yield name, _measure(fn, number, repeat)
+
+
+def _contention_benchmarks(names_filter, number: int, threads: int):
+    """threads adet thread aynı anda resolve ederken op başına duvar saati süresi"""
+    c = _container()
+    c.register_singleton(IService, Service)
+    c.register_transient(Leaf)
+    for name, service_type in (("threads.singleton", IService), ("threads.transient", Leaf)):
+        name = f"{name}{threads}"
+        if names_filter and names_filter not in name:
+            continue
+        barrier = threading.Barrier(threads + 1)
+
+        def worker():
+            barrier.wait()
+            for _ in range(number):
+                c.resolve(service_type)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for w in workers:
+            w.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for w in workers:
+            w.join()
+        yield name, (time.perf_counter() - start) / (number * threads) * 1e9
+
+
+_DISCOVERY_PROBE = (
+    "import sys, time; sys.path.insert(0, {path!r}); import ioc_container; "
+    "t = time.perf_counter(); ioc_container.Container(lazy_discovery={lazy}); "
+    "print('elapsed', time.perf_counter() - t)"
+)
+
+
+def _discovery_benchmarks(names_filter, module_counts):
+    """N modüllük bir ağaçta Container() açılış süresi (ayrı süreçte; soğuk = indeks yok, sıcak = indeks var)"""
+    container_dir = str(Path(__file__).resolve().parent)
+    for count in module_counts:
+        for lazy in (False, True):
+            mode = "lazy" if lazy else "eager"
+            names = [f"discovery.{mode}{count}.cold", f"discovery.{mode}{count}.warm"]
+            if names_filter and not any(names_filter in n for n in names):
+                continue
+            with tempfile.TemporaryDirectory() as root:
+                for i in range(count):
+                    package = Path(root, f"pkg{i % 10}")
+                    package.mkdir(exist_ok=True)
+                    (package / f"mod{i}.py").write_text(
+                        "from abc import ABC, abstractmethod\n"
+                        f"class IThing{i}(ABC):\n"
+                        "    @abstractmethod\n"
+                        "    def run(self): ...\n"
+                        f"class Thing{i}(IThing{i}):\n"
+                        "    def run(self): return 1\n"
+                    )
+                probe = _DISCOVERY_PROBE.format(path=container_dir, lazy=lazy)
+                for name in names:
+                    out = subprocess.run([sys.executable, "-c", probe], cwd=root,
+                                         capture_output=True, text=True, check=True).stdout
+                    elapsed = float(out.strip().splitlines()[-1].split()[-1])
+                    yield name, elapsed * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IoC Container benchmark seti")
+    parser.add_argument("--quick", action="store_true", help="kısa tekrar sayıları")
+    parser.add_argument("--json", action="store_true", help="satır başına JSON çıktı")
+    parser.add_argument("-k", dest="names_filter", default="", help="sadece adında bu metin geçenler")
+    args = parser.parse_args(argv)
+
+    number, repeat = (2_000, 3) if args.quick else (20_000, 5)
+    module_counts = (10, 100) if args.quick else (10, 100, 1000)
+    threads = min(8, os.cpu_count() or 1)
+
+    if not args.json:
+        print(f"# ioc_container_bench v{FORMAT_VERSION} python={platform.python_version()}")
+
+    results = [
+        *_micro_benchmarks(args.names_filter, number, repeat),
+        *_contention_benchmarks(args.names_filter, number, threads),
+        *_discovery_benchmarks(args.names_filter, module_counts),
+    ]
+    for name, ns_per_op in results:
+        if args.json:
+            print(json.dumps({"benchmark": name, "ns_per_op": round(ns_per_op, 1),
+                              "ops_per_sec": round(1e9 / ns_per_op, 1),
+                              "format": FORMAT_VERSION, "python": platform.python_version()}))
+        else:
+            print(f"{name}\t{ns_per_op:.1f}\t{1e9 / ns_per_op:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,999 @@
+"""
+IoC Container doğruluk testleri (pytest).
+
+Çalıştırma:
+    python -m pytest -q IoC_Container
+
+Not: dosya adında "ioc_container" geçtiği için container'ın otomatik keşfi bu dosyayı yüklemez.
+Async testler ek eklenti gerektirmemek için asyncio.run ile çalıştırılır.
+"""
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import textwrap
+import threading
+import time
+import types
+from abc import ABC, abstractmethod
+from typing import Callable, List
+
+import pytest
+
+import ioc_container
+from ioc_container import (AmbientScopePolicy, CircularDependencyError, Container, DiscoveryIndex, ForkPolicy,
+                           Lazy, LazyProxy, LifetimeScope, Provider, _EMPTY)
+
+
+def _container(**kwargs) -> Container:
+    return Container(auto_discover=False, **kwargs)
+
+
+class Dep:
+    pass
+
+
+# ---------------------------------------------------------------- tanı kayıtları
+def test_enable_diagnostics_replaces_previous_handler():
+    logger = logging.getLogger("ioc_container")
+    before, level = list(logger.handlers), logger.level
+    try:
+        ioc_container.enable_diagnostics()
+        ioc_container.enable_diagnostics()
+        assert len(logger.handlers) == len(before) + 1
+        custom = logging.NullHandler()
+        ioc_container.enable_diagnostics(logging.INFO, custom)
+        assert logger.handlers[len(before):] == [custom] and logger.level == logging.INFO
+    finally:
+        for handler in logger.handlers[len(before):]:
+            logger.removeHandler(handler)
+        ioc_container._diagnostics_handler = None
+        logger.setLevel(level)
+
+
+# ---------------------------------------------------------------- thread-safe singleton
+class SlowSingleton:
+    created = 0
+
+    def __init__(self):
+        time.sleep(0.01)  # diğer thread'lerin aynı anda oluşturmaya girmesi için pencere
+        type(self).created += 1
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_singleton_created_exactly_once_under_threads(compiled):
+    SlowSingleton.created = 0
+    c = _container()
+    c.register_singleton(SlowSingleton)
+    if compiled:
+        c.compile()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(c.resolve(SlowSingleton))
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8 and all(r is results[0] for r in results)
+    assert SlowSingleton.created == 1
+
+
+# ---------------------------------------------------------------- resolve_async
+def test_resolve_async_concurrent_resolves_create_once():
+    c = _container()
+    created = {"singleton": 0, "scoped": 0}
+
+    async def make_singleton(_):
+        created["singleton"] += 1
+        await asyncio.sleep(0.01)
+        return Dep()
+
+    async def make_scoped(_):
+        created["scoped"] += 1
+        await asyncio.sleep(0.01)
+        return ScopedDep()
+    c.register_factory(Dep, make_singleton, LifetimeScope.SINGLETON)
+    c.register_factory(ScopedDep, make_scoped, LifetimeScope.SCOPED)
+
+    async def main():
+        singletons = await asyncio.gather(*(c.resolve_async(Dep) for _ in range(10)))
+        async with c.create_scope() as scope:
+            scoped = await asyncio.gather(*(scope.resolve_async(ScopedDep) for _ in range(10)))
+        return singletons, scoped
+
+    singletons, scoped = asyncio.run(main())
+    assert all(s is singletons[0] for s in singletons) and all(s is scoped[0] for s in scoped)
+    assert created == {"singleton": 1, "scoped": 1}
+    assert scoped[0].disposed
+
+
+# ---------------------------------------------------------------- döngü tespiti
+class CycleA:
+    def __init__(self, b):
+        self.b = b
+
+
+class CycleB:
+    def __init__(self, a: CycleA):
+        self.a = a
+
+
+CycleA.__init__.__annotations__["b"] = CycleB  # ileri referans: container string annotation çözmez
+
+
+def _cycle_container(scope: LifetimeScope) -> Container:
+    c = _container()
+    c.register(CycleA, scope=scope)
+    c.register(CycleB, scope=scope)
+    return c
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_cycle_raises_circular_dependency_error(compiled):
+    c = _container()
+    c.register_singleton(CycleA)
+    c.register_transient(CycleB)
+    if compiled:
+        c.compile()
+    with pytest.raises(CircularDependencyError) as info:
+        c.resolve(CycleA)
+    assert info.value.path == ["CycleA", "CycleB", "CycleA"]
+
+
+def test_resolve_async_cycle_raises():
+    c = _cycle_container(LifetimeScope.SINGLETON)
+    with pytest.raises(CircularDependencyError):
+        asyncio.run(asyncio.wait_for(c.resolve_async(CycleA), 2))
+
+
+@pytest.mark.parametrize("scope", [LifetimeScope.SINGLETON, LifetimeScope.SCOPED])
+def test_concurrent_resolve_async_of_cycle_raises_instead_of_hanging(scope):
+    c = _cycle_container(scope)
+
+    async def main():
+        async with c.create_scope():
+            await asyncio.wait_for(asyncio.gather(c.resolve_async(CycleA), c.resolve_async(CycleB)), 2)
+
+    with pytest.raises(CircularDependencyError):
+        asyncio.run(main())
+    assert c._async_waits == {}
+
+
+def test_warm_up_async_cycle_raises_instead_of_hanging():
+    c = _cycle_container(LifetimeScope.SINGLETON)
+    with pytest.raises(CircularDependencyError):
+        asyncio.run(asyncio.wait_for(c.warm_up_async(), 2))
+
+
+# ---------------------------------------------------------------- scope dispose
+def test_dispose_during_async_scoped_create_does_not_store_late_result():
+    c = _container()
+
+    async def make(_):
+        await asyncio.sleep(0.02)
+        return Dep()
+    c.register_factory(Dep, make, LifetimeScope.SCOPED)
+
+    async def main():
+        scope = c.create_scope()
+        async with scope:
+            task = asyncio.ensure_future(scope.resolve_async(Dep))
+            await asyncio.sleep(0)
+        instance = await task
+        return scope, instance
+
+    scope, instance = asyncio.run(main())
+    assert isinstance(instance, Dep)
+    assert scope.scope_manager.get(c.registrations[Dep].slot) is _EMPTY
+
+
+# ---------------------------------------------------------------- scope havuzu ve contextvar
+def test_scope_pool_reuses_disposed_scopes_with_fresh_instances():
+    c = _container(scope_pool_size=1)
+    c.register_scoped(ScopedDep)
+    with c.create_scope() as scope:
+        first = scope.resolve(ScopedDep)
+    with c.create_scope() as reused:
+        assert reused is scope
+        assert reused.resolve(ScopedDep) is not first
+    assert first.disposed
+
+
+def test_current_scope_is_not_visible_from_other_threads():
+    c = _container()
+    seen = []
+    with c.create_scope() as scope:
+        thread = threading.Thread(target=lambda: seen.append(c.current_scope))
+        thread.start()
+        thread.join()
+        assert c.current_scope is scope.scope_manager
+    assert seen == [None] and c.current_scope is None
+
+
+def test_async_tasks_keep_their_own_scope():
+    c = _container()
+    c.register_scoped(ScopedDep)
+
+    async def request():
+        async with c.create_scope():
+            first = await c.resolve_async(ScopedDep)
+            await asyncio.sleep(0.01)  # diğer task'lar bu arada kendi scope'larına girer
+            assert await c.resolve_async(ScopedDep) is first
+            return first
+
+    async def main():
+        return await asyncio.gather(*(request() for _ in range(5)))
+
+    instances = asyncio.run(main())
+    assert len({id(i) for i in instances}) == 5 and all(i.disposed for i in instances)
+    assert c.current_scope is None
+
+
+# ---------------------------------------------------------------- bounded ambient scope
+class Disposable:
+    def __init__(self):
+        self.disposed = False
+
+    def dispose(self):
+        self.disposed = True
+
+
+class ScopedDep(Disposable):
+    pass
+
+
+class ScopedUser(Disposable):
+    def __init__(self, dep: ScopedDep):
+        super().__init__()
+        self.dep = dep
+
+
+class ScopedOther(Disposable):
+    pass
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_bounded_ambient_scope_does_not_dispose_live_dependencies(compiled):
+    c = _container(ambient_scope_policy=AmbientScopePolicy(max_instances=1))
+    c.register_scoped(ScopedDep)
+    c.register_scoped(ScopedUser)
+    if compiled:
+        c.compile()
+    user = c.resolve(ScopedUser)
+    assert not user.dep.disposed
+    assert c.resolve(ScopedUser) is user
+
+
+def test_bounded_ambient_scope_evicts_least_recently_used():
+    c = _container(ambient_scope_policy=AmbientScopePolicy(max_instances=1))
+    c.register_scoped(ScopedDep)
+    c.register_scoped(ScopedOther)
+    dep = c.resolve(ScopedDep)
+    other = c.resolve(ScopedOther)
+    assert dep.disposed and not other.disposed
+    assert c.resolve(ScopedDep) is not dep
+
+
+def test_bounded_ambient_scope_ttl_evicts_dependents_with_dependency():
+    c = _container(ambient_scope_policy=AmbientScopePolicy(ttl=0.01))
+    c.register_scoped(ScopedDep)
+    c.register_scoped(ScopedUser)
+    user = c.resolve(ScopedUser)
+    time.sleep(0.02)
+    c.resolve(ScopedDep)
+    assert user.disposed and user.dep.disposed
+    assert c.resolve(ScopedUser) is not user
+
+
+# ---------------------------------------------------------------- Lazy[T]
+class Bag(list):
+    created = 0
+
+    def __init__(self):
+        super().__init__()
+        type(self).created += 1
+
+
+class BagUser:
+    def __init__(self, bag: Lazy[Bag], dep: Lazy[Dep]):
+        self.bag = bag
+        self.dep = dep
+
+
+class LazyCycleA:
+    def __init__(self, b):
+        self.b = b
+
+
+class LazyCycleB:
+    def __init__(self, a: Lazy[LazyCycleA]):
+        self.a = a
+
+
+LazyCycleA.__init__.__annotations__["b"] = LazyCycleB
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_lazy_defers_creation_and_forwards_common_dunders(compiled):
+    Bag.created = 0
+    c = _container()
+    c.register_singleton(Bag)
+    c.register_singleton(Dep)
+    c.register_transient(BagUser)
+    if compiled:
+        c.compile()
+    user = c.resolve(BagUser)
+    assert type(user.bag) is LazyProxy and Bag.created == 0
+    user.bag.append(1)
+    assert Bag.created == 1
+    assert len(user.bag) == 1 and list(user.bag) == [1] and 1 in user.bag and user.bag[0] == 1
+    assert user.bag == [1] and isinstance(user.bag, Bag)
+    dep = c.resolve(Dep)
+    assert user.dep == dep and hash(user.dep) == hash(dep) and {user.dep: 1}[dep] == 1
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_lazy_breaks_cycle(compiled):
+    c = _container()
+    c.register_singleton(LazyCycleA)
+    c.register_singleton(LazyCycleB)
+    if compiled:
+        c.compile()
+    a = c.resolve(LazyCycleA)
+    assert a.b.a == a and a.b.a.b is a.b
+
+
+# ---------------------------------------------------------------- Provider[T] / Callable[[], T]
+class RowFactoryUser:
+    def __init__(self, make_row: Provider[Dep], make_scoped: Callable[[], ScopedDep]):
+        self.make_row = make_row
+        self.make_scoped = make_scoped
+
+
+class ProviderCycleA:
+    def __init__(self, b):
+        self.b = b
+
+
+class ProviderCycleB:
+    def __init__(self, make_a: Provider[ProviderCycleA]):
+        self.make_a = make_a
+
+
+ProviderCycleA.__init__.__annotations__["b"] = ProviderCycleB
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_provider_and_callable_follow_registered_lifetime(compiled):
+    c = _container()
+    c.register_transient(Dep)
+    c.register_scoped(ScopedDep)
+    c.register_transient(RowFactoryUser)
+    if compiled:
+        c.compile()
+    with c.create_scope():
+        user = c.resolve(RowFactoryUser)
+        first, second = user.make_row(), user.make_row()
+        assert isinstance(first, Dep) and first is not second
+        scoped = user.make_scoped()
+        assert user.make_scoped() is scoped is c.resolve(ScopedDep)
+    with c.create_scope():
+        assert user.make_scoped() is not scoped  # çağrı anındaki scope kullanılır
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_provider_breaks_cycle(compiled):
+    c = _container()
+    c.register_singleton(ProviderCycleA)
+    c.register_singleton(ProviderCycleB)
+    if compiled:
+        c.compile()
+    a = c.resolve(ProviderCycleA)
+    assert a.b.make_a() is a
+
+
+# ---------------------------------------------------------------- havuzlu (POOLED) servisler
+class Pooled(Disposable):
+    pass
+
+
+def test_pooled_reuses_instance_after_scope_and_respects_max_size():
+    c = _container()
+    c.register_pooled(Pooled, max_size=1, borrow_timeout=0.05)
+    with c.create_scope() as scope:
+        first = scope.resolve(Pooled)
+        assert scope.resolve(Pooled) is first
+        with c.create_scope() as inner:
+            with pytest.raises(TimeoutError):
+                inner.resolve(Pooled)
+    with c.create_scope() as scope:
+        assert scope.resolve(Pooled) is first
+    stats = c.pool_stats(Pooled)
+    assert stats["created"] == 1 and stats["in_use"] == 0
+
+
+def test_pooled_validate_discards_invalid_instances():
+    c = _container()
+    c.register_pooled(Pooled, validate=lambda instance: not instance.disposed)
+    with c.create_scope() as scope:
+        first = scope.resolve(Pooled)
+    first.disposed = True
+    with c.create_scope() as scope:
+        assert scope.resolve(Pooled) is not first
+
+
+def test_resolve_async_pooled_waits_without_blocking_event_loop():
+    c = _container()
+    c.register_pooled(Pooled, max_size=1)
+
+    async def worker():
+        async with c.create_scope() as scope:
+            instance = await scope.resolve_async(Pooled)
+            await asyncio.sleep(0.05)
+            return instance
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(worker(), worker()), 2)
+
+    start = time.perf_counter()
+    first, second = asyncio.run(main())
+    assert first is second
+    assert time.perf_counter() - start < 1
+
+
+def test_resolve_async_pooled_cancelled_wait_returns_instance_to_pool():
+    c = _container()
+    c.register_pooled(Pooled, max_size=1)
+
+    async def waiter():
+        async with c.create_scope() as scope:
+            return await scope.resolve_async(Pooled)
+
+    async def main():
+        with c.create_scope() as holder:
+            holder.resolve(Pooled)
+            task = asyncio.ensure_future(waiter())
+            await asyncio.sleep(0.05)  # task havuzu executor thread'inde bekliyor
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        # holder iade etti; thread'de ödünç alınan instance havuza geri dönmeli
+        for _ in range(100):
+            if c.pool_stats(Pooled)["in_use"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(main(), 3))
+    stats = c.pool_stats(Pooled)
+    assert stats["in_use"] == 0 and stats["idle"] == 1
+
+
+def test_pooled_rejects_async_factories():
+    async def make(_):
+        return Pooled()
+
+    c = _container()
+    with pytest.raises(TypeError):
+        c.register_factory(Pooled, make, LifetimeScope.POOLED)
+    with pytest.raises(TypeError):
+        c.add_implementation(Pooled, factory=make, scope=LifetimeScope.POOLED)
+    assert Pooled not in c.registrations
+
+
+# ---------------------------------------------------------------- fork desteği
+class ForkC:
+    pass
+
+
+class ForkB:
+    def __init__(self, c: ForkC):
+        self.c = c
+
+
+class ForkA:
+    def __init__(self, b: ForkB):
+        self.b = b
+
+
+class ForkShared:
+    pass
+
+
+def _run_in_child(check) -> int:
+    """check'i fork edilmiş çocukta çalıştır; çıkış kodu 0 ise başarılı"""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os._exit(0 if check() else 1)
+        except BaseException:
+            os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+needs_fork = pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="os.fork yok")
+
+
+@needs_fork
+def test_prefork_rebuilds_transitive_dependents_of_rebuild_singletons():
+    c = _container()
+    c.register_singleton(ForkC, fork_policy=ForkPolicy.REBUILD)
+    c.register_singleton(ForkB)
+    c.register_singleton(ForkA)
+    c.register_singleton(ForkShared)
+    c.prefork()
+    assert c.registrations[ForkShared].instance is not None
+    assert all(c.registrations[t].instance is None for t in (ForkA, ForkB, ForkC))
+
+    parent_a = c.resolve(ForkA)
+    shared = c.resolve(ForkShared)
+
+    def check():
+        a = c.resolve(ForkA)
+        return (a is not parent_a and a.b is c.resolve(ForkB) and a.b.c is c.resolve(ForkC)
+                and a.b.c is not parent_a.b.c and c.resolve(ForkShared) is shared)
+    assert _run_in_child(check) == 0
+
+
+@needs_fork
+def test_after_fork_resets_scopes_and_pools():
+    c = _container()
+    c.register_scoped(ScopedDep)
+    c.register_pooled(Pooled, max_size=1)
+    ambient = c.resolve(ScopedDep)
+
+    def check():
+        stats = c.pool_stats(Pooled)
+        return c.resolve(ScopedDep) is not ambient and stats["in_use"] == 0 and stats["idle"] == 0
+    with c.create_scope() as scope:
+        borrowed = scope.resolve(Pooled)
+        assert _run_in_child(check) == 0
+    assert c.pool_stats(Pooled)["idle"] == 1 and not borrowed.disposed  # ebeveyn etkilenmez
+
+
+@needs_fork
+def test_after_fork_failure_in_one_container_does_not_skip_resets(monkeypatch):
+    broken, healthy = _container(), _container()
+    for c in (broken, healthy):
+        c.register_scoped(ScopedDep)
+        c.register_pooled(Pooled, max_size=1)
+
+    def fail():
+        raise RuntimeError("rebuild kümesi hesaplanamadı")
+    monkeypatch.setattr(broken, "_fork_rebuild_set", fail)
+    ambient = {c: c.resolve(ScopedDep) for c in (broken, healthy)}
+
+    def check():
+        return all(c.pool_stats(Pooled)["in_use"] == 0 and c.resolve(ScopedDep) is not ambient[c]
+                   for c in (broken, healthy))
+    with broken.create_scope() as first, healthy.create_scope() as second:
+        first.resolve(Pooled)
+        second.resolve(Pooled)
+        assert _run_in_child(check) == 0
+
+
+# ---------------------------------------------------------------- çoklu implementation
+class IPlugin(ABC):
+    @abstractmethod
+    def name(self): ...
+
+
+class AuditPlugin(IPlugin):
+    def name(self):
+        return "audit"
+
+
+class CachePlugin(IPlugin):
+    def name(self):
+        return "cache"
+
+
+class PluginHost:
+    def __init__(self, plugins: List[IPlugin]):
+        self.plugins = plugins
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_resolve_all_and_list_injection_keep_registration_order(compiled):
+    c = _container()
+    c.register_singleton(IPlugin, AuditPlugin)
+    c.add_implementation(IPlugin, CachePlugin, LifetimeScope.SCOPED)
+    c.register_transient(PluginHost)
+    if compiled:
+        c.compile()
+    with c.create_scope() as scope:
+        assert [p.name() for p in scope.resolve_all(IPlugin)] == ["audit", "cache"]
+        assert [p.name() for p in scope.resolve(PluginHost).plugins] == ["audit", "cache"]
+        assert scope.resolve(IPlugin).name() == "cache"
+
+
+def test_add_implementation_applies_register_rules():
+    c = _container(strict_interfaces=True)
+    c.register_singleton(IPlugin, CachePlugin)
+    c.add_implementation(IPlugin)  # soyut servis: implementation tahmin edilir
+    assert all(not inspect.isabstract(type(p)) for p in c.resolve_all(IPlugin))
+    with pytest.raises(TypeError):
+        c.add_implementation(AuditPlugin)
+
+
+def test_resolve_many_is_counted_by_instrumentation():
+    c = _container()
+    c.register_transient(Dep)
+    c.enable_instrumentation()
+    assert len(c.resolve_many([Dep, Dep])) == 2
+    assert c.instrumentation_snapshot()[Dep]["resolves"] == 2
+
+
+# ---------------------------------------------------------------- validate
+class CaptiveSingleton:
+    def __init__(self, dep: ScopedDep):
+        self.dep = dep
+
+
+def test_validate_reports_captive_dependency_after_warm_up():
+    c = _container()
+    c.register_scoped(ScopedDep)
+    c.register_singleton(CaptiveSingleton)
+    c.register_instance(IRepo, Repo())
+    c.warm_up()
+    assert c.registrations[CaptiveSingleton].instance is not None
+    report = c.validate(raise_on_error=False)
+    assert len(report.captive) == 1 and "CaptiveSingleton" in report.captive[0]
+    assert not report.missing
+
+
+# ---------------------------------------------------------------- warm_up
+class WarmDep:
+    pass
+
+
+class WarmUser:
+    def __init__(self, dep: WarmDep):
+        self.dep = dep
+
+
+def test_warm_up_builds_every_singleton_implementation():
+    c = _container()
+    c.register_singleton(IPlugin, AuditPlugin)
+    c.add_implementation(IPlugin, CachePlugin, LifetimeScope.SINGLETON)
+    c.warm_up()
+    assert all(r.instance is not None for r in c._registrations_of(IPlugin))
+
+
+def test_warm_up_async_follows_dependency_order_and_fills_pools():
+    c = _container()
+
+    async def make_dep(_):
+        await asyncio.sleep(0.01)  # bağımlı singleton bu task bitmeden başlatılmamalı
+        return WarmDep()
+    c.register_factory(WarmDep, make_dep, LifetimeScope.SINGLETON)
+    c.register_singleton(WarmUser)
+    c.register_singleton(IPlugin, AuditPlugin)
+    c.add_implementation(IPlugin, CachePlugin, LifetimeScope.SINGLETON)
+    c.register_pooled(Pooled, min_size=2)
+
+    timings = asyncio.run(asyncio.wait_for(c.warm_up_async(), 2))
+    assert set(timings) == {WarmDep, WarmUser, IPlugin}
+    assert c.registrations[WarmUser].instance.dep is c.registrations[WarmDep].instance
+    assert all(r.instance is not None for r in c._registrations_of(IPlugin))
+    assert c.pool_stats(Pooled)["idle"] == 2
+
+
+# ---------------------------------------------------------------- snapshot
+class IRepo(ABC):
+    @abstractmethod
+    def get(self): ...
+
+
+class Repo(IRepo):
+    def get(self):
+        return "repo"
+
+
+class Service:
+    def __init__(self, repo: IRepo, retries: int = 3):
+        self.repo = repo
+        self.retries = retries
+
+
+def is_valid(instance) -> bool:
+    return not instance.disposed
+
+
+def test_snapshot_round_trip(tmp_path):
+    c = _container()
+    c.register_singleton(IRepo, Repo)
+    c.register_transient(Service)
+    c.register_pooled(Pooled, max_size=3, validate=is_valid)
+    c.register_singleton(Dep, fork_policy=ForkPolicy.REBUILD)
+    path = tmp_path / "container.json"
+    assert c.export_snapshot(path) == []
+
+    loaded = Container.from_snapshot(path)
+    service = loaded.resolve(Service)
+    assert service.repo.get() == "repo" and service.retries == 3
+    assert service.repo is loaded.resolve(IRepo)
+    assert loaded.registrations[Service].plan is not None  # plan dosyadan geldi
+    pool = loaded.registrations[Pooled].pool
+    assert pool.max_size == 3 and pool.validate is is_valid
+    assert loaded.registrations[Dep].fork_policy is ForkPolicy.REBUILD
+
+
+def test_snapshot_skips_instances_even_after_compile(tmp_path):
+    c = _container()
+    c.register_instance(IRepo, Repo())
+    c.register_transient(Service)
+    c.compile()
+    assert c.export_snapshot(tmp_path / "container.json") == [IRepo]
+
+
+def test_snapshot_skips_pools_with_unserializable_validate(tmp_path):
+    c = _container()
+    c.register_pooled(Pooled, validate=lambda instance: True)
+    assert c.export_snapshot(tmp_path / "container.json") == [Pooled]
+
+
+# ---------------------------------------------------------------- ayrı süreçte oluşturma
+class ProcessConfig:
+    pass
+
+
+class ProcessHeavy:
+    def __init__(self, cfg: ProcessConfig):
+        self.cfg = cfg
+
+
+def test_build_in_process_warns_that_dependencies_are_copied(caplog):
+    c = _container()
+    c.register_singleton(ProcessConfig)
+    c.register_singleton(ProcessHeavy, build_in_process=True)
+    with caplog.at_level("WARNING"):
+        heavy = c.resolve(ProcessHeavy)
+    assert isinstance(heavy.cfg, ProcessConfig) and heavy.cfg is not c.resolve(ProcessConfig)
+    assert any("ProcessHeavy" in r.getMessage() and "cfg" in r.getMessage() for r in caplog.records)
+
+
+# ---------------------------------------------------------------- keşif indeksi
+def _write(root, relative, source):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def discovery_root(tmp_path, monkeypatch):
+    """Keşif kökü olarak tmp_path; testte yüklenen modüller sys.modules'tan geri alınır"""
+    monkeypatch.setattr(ioc_container, "_default_root_dir", lambda: tmp_path)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.delenv(DiscoveryIndex.DIR_ENV, raising=False)
+    yield tmp_path
+    for name, module in list(sys.modules.items()):
+        if str(getattr(module, "__file__", "") or "").startswith(str(tmp_path)):
+            del sys.modules[name]
+
+
+def test_discovery_index_refreshes_only_changed_new_and_deleted_files(tmp_path, monkeypatch):
+    monkeypatch.delenv(DiscoveryIndex.DIR_ENV, raising=False)
+    _write(tmp_path, "alpha.py", "class Alpha:\n    pass\n")
+    beta = _write(tmp_path, "pkg/beta.py", "class Beta:\n    pass\n")
+    index = DiscoveryIndex(tmp_path)
+    assert index.refresh() == 2
+    assert index.refresh() == 0
+    assert (tmp_path / DiscoveryIndex.FILE_NAME).exists()
+
+    _write(tmp_path, "alpha.py", "class Alpha:\n    pass\n\n\nclass AlphaTwo(Alpha):\n    pass\n")
+    beta.unlink()
+    _write(tmp_path, "gamma.py", "class Gamma:\n    pass\n")
+    assert index.refresh() == 2  # alpha değişti, gamma yeni
+    assert set(index.entries) == {"alpha.py", "gamma.py"}
+    assert set(index.entries["alpha.py"]["classes"]) == {"Alpha", "AlphaTwo"}
+
+    reloaded = DiscoveryIndex(tmp_path)  # diskteki indeks: değişmeyen dosya tekrar parse edilmez
+    assert reloaded.refresh() == 0 and set(reloaded.entries) == {"alpha.py", "gamma.py"}
+
+
+def test_discovery_index_location_is_configurable(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv(DiscoveryIndex.DIR_ENV, str(cache))
+    _write(tmp_path / "src", "alpha.py", "class Alpha:\n    pass\n")
+    index = DiscoveryIndex(tmp_path / "src")
+    index.refresh()
+    assert not (tmp_path / "src" / DiscoveryIndex.FILE_NAME).exists()
+    assert index.index_path.parent == cache and index.index_path.exists()
+
+
+def test_import_candidate_modules_loads_only_candidates(discovery_root):
+    _write(discovery_root, "disc_api.py", """
+        from abc import ABC, abstractmethod
+
+        class INotifier(ABC):
+            @abstractmethod
+            def send(self): ...
+    """)
+    _write(discovery_root, "disc_impl/mail.py", """
+        from disc_api import INotifier
+
+        class MailNotifier(INotifier):
+            def send(self):
+                return "mail"
+    """)
+    _write(discovery_root, "disc_unrelated.py", "class Unrelated:\n    pass\n")
+    sys.path.insert(0, str(discovery_root))
+    from disc_api import INotifier
+
+    assert ioc_container._import_candidate_modules(INotifier, discovery_root) == 1
+    assert "disc_impl.mail" in sys.modules and "disc_unrelated" not in sys.modules
+
+
+def test_register_retries_with_forced_index_refresh(discovery_root):
+    _write(discovery_root, "disc_late_api.py", """
+        from abc import ABC, abstractmethod
+
+        class IExporter(ABC):
+            @abstractmethod
+            def export(self): ...
+    """)
+    sys.path.insert(0, str(discovery_root))
+    from disc_late_api import IExporter
+    ioc_container._discovery_index(discovery_root)  # implementation henüz yokken indekslendi
+
+    _write(discovery_root, "disc_late_impl.py", """
+        from disc_late_api import IExporter
+
+        class CsvExporter(IExporter):
+            def export(self):
+                return "csv"
+    """)
+    c = _container()
+    c.register_singleton(IExporter)
+    assert c.resolve(IExporter).export() == "csv"
+
+
+def test_discovery_index_treats_intermediate_bases_as_abstract(discovery_root):
+    _write(discovery_root, "repos.py", """
+        from abc import abstractmethod
+        from services import IRepo
+
+        class BaseRepo(IRepo):
+            pass
+
+        class HalfRepo(BaseRepo):
+            @abstractmethod
+            def close(self): ...
+
+        class SqlRepo(BaseRepo):
+            def get(self):
+                return "sql"
+    """)
+    index = DiscoveryIndex(discovery_root)
+    index.refresh()
+    abstract = {name: is_abstract for name, _, _, is_abstract in index.candidate_classes(IRepo)}
+    assert abstract == {"BaseRepo": True, "HalfRepo": True, "SqlRepo": False}
+    assert ioc_container._guess_lazy_impl(IRepo)[0] == "SqlRepo"
+
+
+# ---------------------------------------------------------------- bellek içi implementation indeksi
+def test_implementation_index_indexes_new_modules_and_rescans_grown_namespaces(monkeypatch):
+    index = ioc_container._ImplementationIndex()
+    module = types.ModuleType("impl_index_mod")
+    module.Repo = type("SqlRepo", (IRepo,), {"get": lambda self: "sql"})
+    module.IRepo = IRepo  # soyut: indekse girmez
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    index.refresh()
+    assert index.by_name["SqlRepo"] == [module.Repo] and IRepo not in index.classes
+    assert module.Repo in index.subclasses_of(IRepo)
+
+    # __main__ ya da yarım yüklenmiş modül gibi: tarandıktan sonra yeni isim tanımlandı
+    module.Late = type("LateRepo", (IRepo,), {"get": lambda self: "late"})
+    index.refresh()
+    assert index.by_name["LateRepo"] == [module.Late]
+    assert module.Late in index.subclasses_of(IRepo)  # sürüm değişti, cache yenilendi
+
+
+def test_implementation_index_finds_virtual_subclasses(monkeypatch):
+    index = ioc_container._ImplementationIndex()
+    module = types.ModuleType("impl_index_virtual")
+
+    class IVirtual(ABC):
+        pass
+
+    class Registered:
+        pass
+    IVirtual.register(Registered)
+    module.Registered = Registered
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    index.refresh()
+    assert index.subclasses_of(IVirtual) == [Registered]
+
+
+# ---------------------------------------------------------------- register_many
+def _module(monkeypatch, name, source):
+    module = types.ModuleType(name)
+    exec(textwrap.dedent(source), module.__dict__)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+_BULK_SOURCE = """
+    from abc import ABC, abstractmethod
+
+    class IMailer(ABC):
+        @abstractmethod
+        def send(self): ...
+
+    class IClock(ABC):
+        @abstractmethod
+        def now(self): ...
+
+    class SmtpMailer(IMailer):
+        def send(self):
+            return "smtp"
+
+    class SystemClock(IClock):
+        def now(self):
+            return 0
+"""
+
+
+def test_register_many_accepts_list_dict_and_module(discovery_root, monkeypatch):
+    mod = _module(monkeypatch, "bulk_services", _BULK_SOURCE)
+
+    c = _container()
+    assert c.register_many([mod.IMailer, (mod.IClock, LifetimeScope.SINGLETON)]) == {
+        mod.IMailer: mod.SmtpMailer, mod.IClock: mod.SystemClock}
+    assert c.registrations[mod.IClock].scope == LifetimeScope.SINGLETON
+    assert c.registrations[mod.IMailer].scope == LifetimeScope.TRANSIENT
+
+    c = _container()
+    c.register_many({mod.IMailer: LifetimeScope.SCOPED, mod.IClock: LifetimeScope.SINGLETON})
+    assert c.registrations[mod.IMailer].scope == LifetimeScope.SCOPED
+
+    c = _container()
+    assert set(c.register_many(mod, LifetimeScope.SINGLETON)) == {mod.IMailer, mod.IClock}
+    assert c.resolve(mod.IMailer).send() == "smtp"
+
+
+def test_register_many_reports_all_missing_and_registers_nothing(discovery_root, monkeypatch):
+    mod = _module(monkeypatch, "bulk_missing", _BULK_SOURCE + """
+    class IOrphan(ABC):
+        @abstractmethod
+        def run(self): ...
+
+    class IGhost(ABC):
+        @abstractmethod
+        def haunt(self): ...
+    """)
+    c = _container()
+    with pytest.raises(ValueError) as info:
+        c.register_many([mod.IMailer, mod.IOrphan, mod.IGhost])
+    assert "IOrphan" in str(info.value) and "IGhost" in str(info.value)
+    assert c.registrations == {}
+
+
+def test_register_many_logs_ambiguous_matches(discovery_root, monkeypatch, caplog):
+    mod = _module(monkeypatch, "bulk_ambiguous", _BULK_SOURCE + """
+    class UtcClock(IClock):
+        def now(self):
+            return 1
+    """)
+    c = _container()
+    with caplog.at_level("WARNING"):
+        chosen = c.register_many([mod.IClock])
+    assert chosen[mod.IClock] in (mod.SystemClock, mod.UtcClock)
+    message = "\n".join(r.getMessage() for r in caplog.records)
+    assert "bulk_ambiguous.SystemClock" in message and "bulk_ambiguous.UtcClock" in message
+
+
+def test_register_many_strict_mode_rejects_concrete_types_like_register():
+    c = _container(strict_interfaces=True)
+    with pytest.raises(TypeError):
+        c.register(Dep)
+    with pytest.raises(TypeError):
+        c.register_many([Dep])
+    assert c.registrations == {}